@@ -0,0 +1,144 @@
+"""
+Shared tracked-file listing for the gate scripts.
+
+`git ls-files` reads only the index, so its output is fixed until the index
+file changes. Chained gates (gate_build, lint_config, lint_sql) reuse one
+on-disk listing keyed by the index's stat, the working directory and the
+pathspecs, and skip forking git on a hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+
+# Per-user by default; the directory and every entry must belong to the
+# current user before a listing is trusted.
+CACHE_DIR = Path(
+    os.getenv("HEIWA_GITCACHE_DIR")
+    or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "heiwa" / "gitcache"
+)
+# Listings for indexes that have since changed are never read again.
+CACHE_MAX_AGE_SEC = 24 * 3600
+
+
+def _owned_by_user(st: os.stat_result) -> bool:
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def _cache_dir() -> Path | None:
+    """CACHE_DIR if it is a private directory of ours, else ``None``."""
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(CACHE_DIR)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or not _owned_by_user(st) or st.st_mode & 0o022:
+        return None
+    return CACHE_DIR
+
+
+def _index_path(cwd: Path) -> Path | None:
+    env_index = os.getenv("GIT_INDEX_FILE")
+    if env_index:
+        return Path(env_index) if os.path.isabs(env_index) else cwd / env_index
+    for parent in (cwd, *cwd.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git / "index"
+        if dot_git.is_file():
+            # Worktrees and submodules point at their real git dir.
+            text = dot_git.read_text(encoding="utf-8").strip()
+            if text.startswith("gitdir:"):
+                git_dir = Path(text[len("gitdir:"):].strip())
+                return (git_dir if git_dir.is_absolute() else parent / git_dir) / "index"
+            return None
+    return None
+
+
+def _cache_key(cwd: Path, patterns: tuple[str, ...]) -> str | None:
+    try:
+        index = _index_path(cwd)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if index is None:
+        return None
+    try:
+        st = index.stat()
+    except OSError:
+        return None
+    raw = "\0".join([str(cwd), str(index), str(st.st_ino), str(st.st_size), str(st.st_mtime_ns), *patterns])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _load(path: Path) -> str | None:
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    try:
+        with os.fdopen(fd, "r", encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or not _owned_by_user(st):
+                return None
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _store(cache_dir: Path, path: Path, data: str) -> None:
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return
+    cutoff = time.time() - CACHE_MAX_AGE_SEC
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def tracked(cwd: Path, *patterns: str) -> list[Path]:
+    """Files under ``cwd`` tracked by git that match ``patterns``.
+
+    Any cache problem counts as a miss; git itself is always the fallback.
+    Raises ``subprocess.CalledProcessError``/``OSError`` when git cannot run.
+    """
+    key = _cache_key(cwd, patterns)
+    cache_dir = _cache_dir() if key else None
+    cache_file = cache_dir / key if cache_dir else None
+    data = _load(cache_file) if cache_file else None
+    if data is None:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--", *patterns],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        data = result.stdout
+        if cache_file is not None:
+            _store(cache_dir, cache_file, data)
+    return [cwd / name for name in data.split("\0") if name]
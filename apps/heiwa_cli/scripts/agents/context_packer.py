@@ -2,17 +2,28 @@
 # cli/scripts/agents/context_packer.py
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
 import os
 import re
+import shutil
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 import yaml
 
 DEFAULT_OUT = "runtime/context/CONTEXT_PACK.md"
+WRITE_BUFFER_BYTES = 1 << 20
+# Files read and hashed concurrently; hashlib drops the GIL on large inputs.
+READ_WORKERS = 8
+# Reads allowed to run ahead of the writer, bounding buffered file text.
+READ_AHEAD = 2 * READ_WORKERS
 
 # Hard deny patterns (avoid secrets)
 DENY_GLOBS = [
@@ -45,37 +56,245 @@ class Limits:
 def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
-def read_text_bounded(path: Path, limit: int) -> Tuple[str, int, str]:
-    raw = path.read_bytes()
-    h = sha256_bytes(raw)
-    if len(raw) > limit:
-        raw = raw[:limit]
+def read_text_bounded(path: str, limit: int) -> Tuple[str, int, str]:
+    # Hash the whole file through a read-only mapping so only the kept prefix
+    # is copied into Python memory; empty files cannot be mapped.
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raw = b""
+            h = sha256_bytes(raw)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h = sha256_bytes(mm)
+                raw = mm[:limit]
     # Conservative decode
     text = raw.decode("utf-8", errors="replace")
     return text, len(raw), h
 
-def glob_many(root: Path, patterns: Iterable[str]) -> List[Path]:
-    out: List[Path] = []
+_WILDCARD_CHARS = frozenset("*?[")
+# Put before symlinked directory names in walked paths; cannot occur in a name.
+_LINK_MARK = "\0"
+
+
+def _segment_regex(seg: str) -> str:
+    """Translate one glob path component; wildcards never cross '/'."""
+    out: List[str] = []
+    i, n = 0, len(seg)
+    while i < n:
+        c = seg[i]
+        i += 1
+        if c == "*":
+            out.append("[^/\0]*")
+        elif c == "?":
+            out.append("[^/\0]")
+        elif c == "[":
+            j = i
+            if j < n and seg[j] == "!":
+                j += 1
+            if j < n and seg[j] == "]":
+                j += 1
+            while j < n and seg[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = seg[i:j].replace("\\", "\\\\")
+                # Escape what re would read as nested sets or set operations.
+                body = re.sub(r"([&~|\[])", r"\\\1", body)
+                if body.startswith("!"):
+                    body = "^" + body[1:] + "\\0"
+                elif body.startswith("^"):
+                    body = "\\" + body
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _split_glob(pattern: str) -> List[str]:
+    return [seg for seg in pattern.split("/") if seg and seg != "."]
+
+
+def _path_regex(segs: List[str]) -> str:
+    """``Path.glob`` semantics: '**' spans whole components but, like pathlib,
+    never a symlinked directory; any other segment may name one."""
+    parts = []
+    for idx, seg in enumerate(segs):
+        if seg == "**":
+            parts.append("(?:[^/\0][^/]*/)*")
+        else:
+            parts.append("\0?" + _segment_regex(seg) + ("/" if idx < len(segs) - 1 else ""))
+    return "".join(parts)
+
+
+def _subtree_regexes(patterns: Tuple[str, ...]) -> List[str]:
+    """Directories denied as a whole: the part of each 'dir/**' pattern before
+    the trailing '**', where '**' spans any number of components."""
+    out = []
     for pat in patterns:
-        out.extend(root.glob(pat))
+        segs = _split_glob(pat)
+        if len(segs) > 1 and segs[-1] == "**":
+            out.append(_path_regex(segs[:-1]))
+    return out
+
+
+@functools.lru_cache(maxsize=32)
+def _allow_regex(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """One alternation matching repo-relative paths the way ``Path.glob`` would."""
+    alts = [_path_regex(_split_glob(pat)) for pat in patterns]
+    return re.compile("(?:" + "|".join(alts) + r")\Z" if alts else r"(?!)")
+
+
+@functools.lru_cache(maxsize=32)
+def _deny_regex(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Right-anchored match with ``PurePath.match`` semantics ('**' acts as '*'),
+    plus anything below a directory a 'dir/**' pattern denies."""
+    alts = []
+    for pat in patterns:
+        segs = ["[^/]*" if seg == "**" else _segment_regex(seg) for seg in _split_glob(pat)]
+        alts.append("(?:^|/)" + "/".join(segs) + r"\Z")
+    alts.extend(f"\\A(?:{sub})/" for sub in _subtree_regexes(patterns))
+    return re.compile("|".join(alts) if alts else r"(?!)")
+
+
+@functools.lru_cache(maxsize=32)
+def _prune_regex(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Directory paths (repo-relative) whose whole subtree ``patterns`` deny."""
+    subs = _subtree_regexes(patterns)
+    return re.compile("(?:" + "|".join(subs) + r")\Z" if subs else r"(?!)")
+
+
+def _walk_files(
+    top: str, top_rel: str, max_depth: float, max_links: int, prune: "re.Pattern[str]"
+) -> Iterable[Tuple[str, str]]:
+    """Yield (path, rel) for files under ``top``.
+
+    ``rel`` is '/'-separated from the repo root with _LINK_MARK before each
+    symlinked directory, at most ``max_links`` of which are entered per path.
+    Directories whose plain rel path matches ``prune`` are skipped.
+    """
+    stack = [(top, top_rel, top_rel, 1, 0)]
+    while stack:
+        current, rel, plain, depth, links = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if depth >= max_depth or prune.match(plain + entry.name):
+                            continue
+                        if not entry.is_symlink():
+                            stack.append((entry.path, rel + entry.name + "/", plain + entry.name + "/", depth + 1, links))
+                        elif links < max_links:
+                            stack.append((entry.path, rel + _LINK_MARK + entry.name + "/", plain + entry.name + "/", depth + 1, links + 1))
+                    elif entry.is_file():
+                        yield entry.path, rel + entry.name
+                except OSError:
+                    continue
+
+
+def read_ahead(
+    pool: ThreadPoolExecutor, files: List[Tuple[str, str]], limit: int
+) -> Iterator[Tuple[str, str, int, str]]:
+    """Yield (rel, text, used_bytes, sha256) in ``files`` order while up to
+    READ_AHEAD later files are read in the background."""
+    pending: deque = deque()
+    queued = iter(files)
+    try:
+        while True:
+            while len(pending) < READ_AHEAD:
+                nxt = next(queued, None)
+                if nxt is None:
+                    break
+                path, rel = nxt
+                pending.append((rel, pool.submit(read_text_bounded, path, limit)))
+            if not pending:
+                return
+            rel, fut = pending.popleft()
+            yield (rel, *fut.result())
+    finally:
+        # The caller stopped early (byte budget); skip reads not yet started.
+        for _, fut in pending:
+            fut.cancel()
+
+
+def glob_many(root: Path, patterns: Iterable[str], deny: Iterable[str] = ()) -> List[str]:
+    """Absolute path strings of files matching any pattern, sorted and unique.
+
+    Directories a 'dir/**' pattern in ``deny`` covers are not walked; callers
+    still filter the result with ``matches_any``.
+    """
+    root_str = str(root)
+    out: List[str] = []
+    wildcard: List[str] = []
+    # literal directory prefix -> deepest level below it any pattern reaches
+    walk_roots: dict[Tuple[str, ...], float] = {}
+    # Only non-'**' segments can name a symlinked directory.
+    max_links = 0
+    for pat in patterns:
+        segs = _split_glob(pat)
+        if pat.startswith("/") or ".." in segs or not segs:
+            # Outside what the single walk models; keep pathlib's behaviour.
+            out.extend(map(str, root.glob(pat)))
+            continue
+        first_wild = next((i for i, seg in enumerate(segs) if _WILDCARD_CHARS & set(seg)), None)
+        if first_wild is None:
+            out.append(os.path.join(root_str, *segs))
+            continue
+        wildcard.append(pat)
+        max_links = max(max_links, sum(seg != "**" for seg in segs) - 1)
+        prefix = tuple(segs[:first_wild])
+        rest = segs[first_wild:]
+        depth = float("inf") if "**" in rest else len(rest)
+        walk_roots[prefix] = max(walk_roots.get(prefix, 0), depth)
+
+    if wildcard:
+        allow_re = _allow_regex(tuple(wildcard))
+        prune_re = _prune_regex(tuple(deny))
+        # Fold nested prefixes into their outermost ancestor so every directory
+        # is scanned once.
+        tops: dict[Tuple[str, ...], float] = {}
+        for prefix in sorted(walk_roots, key=len):
+            for top in tops:
+                if prefix[: len(top)] == top:
+                    tops[top] = max(tops[top], len(prefix) - len(top) + walk_roots[prefix])
+                    break
+            else:
+                tops[prefix] = walk_roots[prefix]
+        for top, depth in tops.items():
+            top_rel = "".join(seg + "/" for seg in top)
+            if prune_re.match(top_rel.rstrip("/")):
+                continue
+            walk = _walk_files(os.path.join(root_str, *top), top_rel, depth, max_links, prune_re)
+            for path, rel in walk:
+                if allow_re.match(rel):
+                    out.append(path)
+
     # unique + stable order
-    seen = set()
-    uniq = []
-    for p in sorted(out, key=lambda x: str(x)):
-        if p.is_file() and p not in seen:
+    seen: set[str] = set()
+    uniq: List[str] = []
+    for p in sorted(out):
+        if p not in seen and os.path.isfile(p):
             seen.add(p)
             uniq.append(p)
     return uniq
 
-def matches_any(path: Path, root: Path, globs: List[str]) -> bool:
-    rel = path.relative_to(root)
-    for g in globs:
-        if rel.match(g):
-            return True
-    return False
+def matches_any(rel: str, globs: List[str]) -> bool:
+    """``rel`` is a '/'-separated path relative to the repo root."""
+    return _deny_regex(tuple(globs)).search(rel) is not None
+
+_TITLE_DROP = re.compile(r"[^\w\-\.\s/]")
+# ASCII deletions derived from the same class, so both paths agree exactly.
+_TITLE_TABLE = {i: None for i in range(128) if _TITLE_DROP.match(chr(i))}
 
 def sanitize_title(s: str) -> str:
-    s = re.sub(r"[^\w\-\.\s/]", "", s)
+    # Repo paths are nearly always ASCII: str.translate handles those;
+    # anything else keeps the Unicode-aware regex.
+    s = s.translate(_TITLE_TABLE) if s.isascii() else _TITLE_DROP.sub("", s)
     return s.strip()
 
 def load_limits(cfg_path: Path) -> Limits:
@@ -103,61 +322,63 @@ def main() -> int:
     # Optional extra allow patterns passed via CLI args
     allow.extend(sys.argv[1:])
 
-    candidates = glob_many(repo, allow)
-    # Deny filter
-    files = [p for p in candidates if not matches_any(p, repo, DENY_GLOBS)]
+    candidates = glob_many(repo, allow, DENY_GLOBS)
+    root_len = len(os.path.join(str(repo), ""))
+    # Deny filter, on repo-relative strings
+    files = []
+    for p in candidates:
+        rel = p[root_len:].replace(os.sep, "/")
+        if not matches_any(rel, DENY_GLOBS):
+            files.append((p, rel))
 
     # Enforce file count
     files = files[: limits.max_files]
 
     total = 0
     manifest = []
-    blocks = []
-
-    for p in files:
-        rel = p.relative_to(repo)
-        text, used_bytes, h = read_text_bounded(p, limits.max_file_bytes_each)
-
-        if total + used_bytes > limits.max_total_bytes:
-            break
-
-        total += used_bytes
-        manifest.append((str(rel), used_bytes, h))
-
-        blocks.append(
-            "\n".join(
-                [
-                    f"## {sanitize_title(str(rel))}",
-                    f"- bytes_used: {used_bytes}",
-                    f"- sha256: {h}",
-                    "",
-                    "```",
-                    text.rstrip(),
-                    "```",
-                    "",
-                ]
-            )
-        )
-
-    header = "\n".join(
-        [
-            "# HEIWA CONTEXT PACK (Deterministic)",
-            "",
-            f"- repo: {repo}",
-            f"- files_included: {len(manifest)}",
-            f"- bytes_total: {total}",
-            "",
-            "## Manifest",
-            "",
-        ]
-    )
 
-    man_lines = ["| path | bytes_used | sha256 |", "|---|---:|---|"]
-    for rel, used, h in manifest:
-        man_lines.append(f"| `{rel}` | {used} | `{h}` |")
+    # File blocks are streamed to a scratch file as they are read; the header
+    # and manifest need the final totals, so they are written first and the
+    # body is copied in after them. newline="" keeps CR/CRLF in file content
+    # intact through the round trip.
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool, tempfile.TemporaryFile(
+        mode="w+", encoding="utf-8", newline="", dir=out_path.parent, buffering=WRITE_BUFFER_BYTES
+    ) as body:
+        reads = read_ahead(pool, files, limits.max_file_bytes_each)
+        for rel, text, used_bytes, h in reads:
+            if total + used_bytes > limits.max_total_bytes:
+                reads.close()
+                break
 
-    content = "\n".join([header, "\n".join(man_lines), "", *blocks])
-    out_path.write_text(content, encoding="utf-8")
+            total += used_bytes
+            manifest.append((rel, used_bytes, h))
+
+            body.write(
+                f"\n## {sanitize_title(rel)}\n"
+                f"- bytes_used: {used_bytes}\n"
+                f"- sha256: {h}\n"
+                "\n```\n"
+            )
+            body.write(text.rstrip())
+            body.write("\n```\n")
+
+        with out_path.open("w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_BYTES) as out:
+            out.write(
+                "# HEIWA CONTEXT PACK (Deterministic)\n"
+                "\n"
+                f"- repo: {repo}\n"
+                f"- files_included: {len(manifest)}\n"
+                f"- bytes_total: {total}\n"
+                "\n"
+                "## Manifest\n"
+                "\n"
+                "| path | bytes_used | sha256 |\n"
+                "|---|---:|---|\n"
+            )
+            for rel, used, h in manifest:
+                out.write(f"| `{rel}` | {used} | `{h}` |\n")
+            body.seek(0)
+            shutil.copyfileobj(body, out, WRITE_BUFFER_BYTES)
 
     print(f"[OK] Wrote {out_path} ({len(manifest)} files, {total} bytes)")
     return 0
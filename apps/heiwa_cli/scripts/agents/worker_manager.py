@@ -6,8 +6,8 @@ executes locally, and streams results back to the hub.
 """
 
 import asyncio
-import json
 import logging
+from collections import deque
 import os
 import sys
 import time
@@ -23,6 +23,7 @@ for pkg in ["heiwa_sdk", "heiwa_protocol", "heiwa_identity"]:
 if str(ROOT / "apps") not in sys.path:
     sys.path.insert(0, str(ROOT / "apps"))
 
+from heiwa_sdk import fastjson
 from heiwa_sdk.config import load_swarm_env, settings
 load_swarm_env()
 
@@ -31,6 +32,26 @@ from heiwa_sdk.routing import ModelRouter
 
 logger = logging.getLogger("WorkerManager")
 
+# Reconnect forever, starting fast and backing off while the hub stays down.
+RECONNECT_WAIT_SEC = 1.0
+RECONNECT_WAIT_MAX_SEC = 30.0
+# Room for bursts of result frames before send() starts applying backpressure,
+# and a bounded close handshake so shutdown flushes instead of hanging.
+WS_CONNECT_OPTIONS = {
+    "open_timeout": 10,
+    "close_timeout": 5,
+    "max_queue": 1024,
+    "write_limit": 8 * 1024 * 1024,
+}
+# Assignments waiting for a free executor; when full, reading from the hub
+# socket pauses so backpressure reaches the sender.
+WORK_QUEUE_SIZE = 64
+# The keepalive frame never changes, so it is serialised once.
+HEARTBEAT_INTERVAL_SEC = 15
+HEARTBEAT_FRAME = fastjson.dumps({"type": "heartbeat"})
+# How long a closing connection may spend sending queued results.
+SHUTDOWN_FLUSH_SEC = 5.0
+
 
 class WorkerManager:
     """Connects to the Railway hub via WS /ws/worker and executes assigned tasks."""
@@ -47,8 +68,21 @@ class WorkerManager:
         self.router = ModelRouter()
         self.mesh = ToolMesh(self.root)
         self.capabilities = self._detect_capabilities()
-        self.concurrency = int(os.getenv("HEIWA_EXECUTOR_CONCURRENCY", "4"))
-        self.sem = asyncio.Semaphore(max(1, self.concurrency))
+        # Identity, token and capabilities are fixed for the process lifetime;
+        # every reconnect re-sends this same frame.
+        self.register_frame = fastjson.dumps({
+            "type": "register",
+            "worker_id": self.node_id,
+            "auth_token": self.auth_token,
+            "capabilities": self.capabilities,
+        })
+        self.concurrency = max(1, int(os.getenv("HEIWA_EXECUTOR_CONCURRENCY", "4")))
+        self.work_q: asyncio.Queue = asyncio.Queue(maxsize=WORK_QUEUE_SIZE)
+        # Outbound result frames; a per-connection sender drains this so
+        # executors never wait on the socket, and frames survive reconnects.
+        # A frame leaves the front only once sent, so order holds across retries.
+        self.out_q: deque[str] = deque()
+        self._out_ready = asyncio.Event()
         self.running = True
 
     def _detect_capabilities(self) -> dict:
@@ -62,34 +96,66 @@ class WorkerManager:
                 caps = {"standard_compute", "workspace_interaction", "agile_coding"}
         return {"runtime": node_type, "capabilities": list(caps), "node_id": self.node_id}
 
-    async def execute(self, payload: Dict[str, Any], ws: Any) -> None:
-        """Execute a task locally and send the result back via WebSocket."""
-        async with self.sem:
-            start = time.time()
-            task_id = str(payload.get("task_id", "unknown"))
-            tool = str(payload.get("target_tool", "openclaw")).lower()
-            instruction = str(payload.get("instruction") or payload.get("raw_text") or "").strip()
-
-            logger.info("Executing %s (tool=%s) ...", task_id, tool)
-            code, out = await self.mesh.execute(tool, instruction)
-            status = "PASS" if code == 0 else "FAIL"
-            duration = int((time.time() - start) * 1000)
-
-            result_msg = {
-                "type": "result",
-                "data": {
-                    "task_id": task_id,
-                    "status": status,
-                    "summary": str(out or ""),
-                    "duration_ms": duration,
-                    "runtime": self.node_id,
-                    "target_tool": tool,
-                },
-            }
+    async def _worker(self) -> None:
+        """Drain queued assignments; ``concurrency`` of these run side by side."""
+        while True:
+            payload = await self.work_q.get()
             try:
-                await ws.send(json.dumps(result_msg))
+                await self.execute(payload)
             except Exception as e:
-                logger.error("Failed to send result for %s: %s", task_id, e)
+                logger.error("Task execution failed: %s", e)
+            finally:
+                self.work_q.task_done()
+
+    async def execute(self, payload: Dict[str, Any]) -> None:
+        """Execute a task locally and queue the result for the hub."""
+        start = time.time()
+        task_id = str(payload.get("task_id", "unknown"))
+        tool = str(payload.get("target_tool", "openclaw")).lower()
+        instruction = str(payload.get("instruction") or payload.get("raw_text") or "").strip()
+
+        logger.info("Executing %s (tool=%s) ...", task_id, tool)
+        code, out = await self.mesh.execute(tool, instruction)
+        status = "PASS" if code == 0 else "FAIL"
+        duration = int((time.time() - start) * 1000)
+
+        result_msg = {
+            "type": "result",
+            "data": {
+                "task_id": task_id,
+                "status": status,
+                "summary": str(out or ""),
+                "duration_ms": duration,
+                "runtime": self.node_id,
+                "target_tool": tool,
+            },
+        }
+        self.out_q.append(fastjson.dumps(result_msg))
+        self._out_ready.set()
+
+    async def _sender(self, ws: Any, stop: asyncio.Event) -> None:
+        """Send queued frames in order; once ``stop`` is set, return when empty."""
+        while True:
+            if not self.out_q:
+                if stop.is_set():
+                    return
+                self._out_ready.clear()
+                await self._out_ready.wait()
+                continue
+            # A failed send leaves the frame at the front for the next connection.
+            await ws.send(self.out_q[0])
+            self.out_q.popleft()
+
+    async def _flush_sender(self, sender: asyncio.Task, stop: asyncio.Event) -> None:
+        """Let the sender empty out_q on the still-open socket, then end it."""
+        stop.set()
+        self._out_ready.set()
+        done, _ = await asyncio.wait({sender}, timeout=SHUTDOWN_FLUSH_SEC)
+        if not done:
+            logger.warning("Result flush timed out; %d frame(s) left queued.", len(self.out_q))
+            sender.cancel()
+        elif not sender.cancelled() and sender.exception() is not None:
+            logger.warning("Result flush failed: %s", sender.exception())
 
     async def run(self) -> None:
         """Connect to hub and process task assignments."""
@@ -102,44 +168,61 @@ class WorkerManager:
         ws_url = self.hub_url.replace("https://", "wss://").replace("http://", "ws://")
         ws_url = f"{ws_url}/ws/worker"
 
-        while self.running:
-            try:
-                logger.info("Connecting to hub at %s ...", ws_url)
-                async with websockets.connect(ws_url, open_timeout=10) as ws:
-                    # Register with auth
-                    await ws.send(json.dumps({
-                        "type": "register",
-                        "worker_id": self.node_id,
-                        "auth_token": self.auth_token,
-                        "capabilities": self.capabilities,
-                    }))
-                    reg_resp = json.loads(await ws.recv())
-                    if reg_resp.get("type") == "error":
-                        logger.error("Registration failed: %s", reg_resp.get("detail"))
-                        return
-                    logger.info("Registered as %s", reg_resp.get("worker_id"))
-
-                    # Start heartbeat loop
-                    asyncio.create_task(self._heartbeat_loop(ws))
-
-                    # Main message loop
-                    async for raw in ws:
-                        msg = json.loads(raw)
-                        msg_type = msg.get("type", "")
-                        if msg_type == "task_assignment":
-                            asyncio.create_task(self.execute(msg.get("data", {}), ws))
-                        elif msg_type == "no_work":
-                            pass
-
-            except Exception as e:
-                logger.warning("Connection lost: %s. Reconnecting in 5s...", e)
-                await asyncio.sleep(5)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        reconnect_wait = RECONNECT_WAIT_SEC
+        try:
+            while self.running:
+                heartbeat = sender = None
+                try:
+                    logger.info("Connecting to hub at %s ...", ws_url)
+                    async with websockets.connect(ws_url, **WS_CONNECT_OPTIONS) as ws:
+                        # Register with auth
+                        await ws.send(self.register_frame)
+                        reg_resp = fastjson.loads(await ws.recv())
+                        if reg_resp.get("type") == "error":
+                            logger.error("Registration failed: %s", reg_resp.get("detail"))
+                            self.running = False
+                            break
+                        logger.info("Registered as %s", reg_resp.get("worker_id"))
+                        reconnect_wait = RECONNECT_WAIT_SEC
+
+                        # Start heartbeat and result sender loops
+                        heartbeat = asyncio.create_task(self._heartbeat_loop(ws))
+                        stop_sending = asyncio.Event()
+                        sender = asyncio.create_task(self._sender(ws, stop_sending))
+
+                        # Main message loop
+                        try:
+                            async for raw in ws:
+                                msg = fastjson.loads(raw)
+                                msg_type = msg.get("type", "")
+                                if msg_type == "task_assignment":
+                                    await self.work_q.put(msg.get("data", {}))
+                                elif msg_type == "no_work":
+                                    pass
+                        finally:
+                            # Shutdown or a closing socket: send what is queued
+                            # while the connection may still carry it.
+                            await self._flush_sender(sender, stop_sending)
+
+                except Exception as e:
+                    logger.warning("Connection lost: %s. Reconnecting in %.0fs...", e, reconnect_wait)
+                    await asyncio.sleep(reconnect_wait)
+                    reconnect_wait = min(reconnect_wait * 2, RECONNECT_WAIT_MAX_SEC)
+                finally:
+                    for loop_task in (heartbeat, sender):
+                        if loop_task is not None:
+                            loop_task.cancel()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await self.mesh.close()
 
     async def _heartbeat_loop(self, ws: Any) -> None:
         try:
             while self.running:
-                await ws.send(json.dumps({"type": "heartbeat"}))
-                await asyncio.sleep(15)
+                await ws.send(HEARTBEAT_FRAME)
+                await asyncio.sleep(HEARTBEAT_INTERVAL_SEC)
         except Exception:
             pass
 
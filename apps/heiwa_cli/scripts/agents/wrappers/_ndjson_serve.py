@@ -0,0 +1,54 @@
+"""
+cli/scripts/agents/wrappers/_ndjson_serve.py
+
+Shared ``--serve`` loop for the Python wrappers kept warm by ToolMesh.
+Requests arrive on stdin as {"id", "payload", "env"} lines; each gets one
+{"id", "code", "output"} line on stdout.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Callable
+
+
+def serve(handler: Callable[[str, str], int]) -> int:
+    """Answer requests with ``handler(payload, request_id)`` until stdin closes.
+
+    The request's env is applied for the call only, and whatever the handler
+    prints becomes the reply's output.
+    """
+    base_env = dict(os.environ)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            _reply(None, 1, f"[ERR] malformed request: {exc}")
+            continue
+        if not isinstance(request, dict):
+            _reply(None, 1, "[ERR] malformed request: expected a JSON object")
+            continue
+        request_id = str(request.get("id", ""))
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            os.environ.update(request.get("env") or {})
+            with redirect_stdout(out), redirect_stderr(err):
+                code = handler(str(request.get("payload") or ""), request_id)
+        except Exception as exc:  # noqa: BLE001
+            code = 1
+            err.write(f"[ERR] {exc}\n")
+        finally:
+            os.environ.clear()
+            os.environ.update(base_env)
+        _reply(request.get("id"), code, (out.getvalue() + err.getvalue()).strip())
+    return 0
+
+
+def _reply(request_id: object, code: int, output: str) -> None:
+    sys.stdout.write(json.dumps({"id": request_id, "code": code, "output": output}) + "\n")
+    sys.stdout.flush()
@@ -6,6 +6,7 @@ Isolated wrapper for Ollama local inference.
 - Full I/O logging
 - Timeout + retry logic
 - Never called directly by agents
+- ``--serve`` keeps one process warm: NDJSON requests on stdin, replies on stdout
 """
 from __future__ import annotations
 
@@ -48,10 +49,12 @@ def load_config() -> Dict:
     }
 
 
-def setup_logging(root: Path) -> tuple[Path, str]:
+def setup_logging(root: Path, request_id: Optional[str] = None) -> tuple[Path, str]:
     log_dir = root / "runtime" / "logs" / "ollama"
     log_dir.mkdir(parents=True, exist_ok=True)
     run_id = f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    if request_id:
+        run_id = f"{run_id}_{request_id}"
     return log_dir, run_id
 
 
@@ -90,21 +93,22 @@ def call_ollama(
         return "", str(e)
 
 
-def main() -> int:
+def main(prompt: Optional[str] = None, request_id: Optional[str] = None) -> int:
     root = Path(os.environ.get("HEIWA_WORKSPACE_ROOT", ".")).resolve()
     cfg = load_config()
     prov = cfg["providers"]["ollama"]
     budgets = cfg["budgets"]
 
-    log_dir, run_id = setup_logging(root)
+    log_dir, run_id = setup_logging(root, request_id)
     log_file = log_dir / f"{run_id}.jsonl"
     payload_file = log_dir / f"{run_id}.payload.txt"
 
     # Read prompt from stdin or args
-    if len(sys.argv) > 1:
-        prompt = " ".join(sys.argv[1:])
-    else:
-        prompt = sys.stdin.read()
+    if prompt is None:
+        if len(sys.argv) > 1:
+            prompt = " ".join(sys.argv[1:])
+        else:
+            prompt = sys.stdin.read()
 
     # Budget check
     max_chars = int(budgets["max_prompt_chars"])
@@ -158,4 +162,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--serve"]:
+        from _ndjson_serve import serve
+
+        raise SystemExit(serve(main))
     raise SystemExit(main())
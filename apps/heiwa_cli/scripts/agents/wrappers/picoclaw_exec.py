@@ -10,16 +10,38 @@ Input can be:
      "command": "search",
      "args": ["heiwa architecture"]
    }
+
+With ``--serve`` the wrapper stays up and answers NDJSON requests
+({"id", "payload", "env"}) on stdin with {"id", "code", "output"} on stdout.
 """
 from __future__ import annotations
 
 import json
 import os
+import queue
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
+
+# Payload text embedded in the START record; longer payloads are cut here.
+LOG_PAYLOAD_CHARS = 4096
+# Runs whose .jsonl logs are kept; older ones are pruned periodically.
+LOG_KEEP_RUNS = int(os.getenv("PICOCLAW_LOG_KEEP", "500"))
+# Seconds between prune passes; the marker file's mtime records the last one,
+# so one-shot runs share the cadence too.
+LOG_PRUNE_INTERVAL_SEC = 300
+LOG_PRUNE_MARKER = ".last_prune"
+# Runs the --serve log writer folds into one pass.
+LOG_WRITE_BATCH = 16
+
+# Set while serve() runs: finished runs' records are handed to a writer
+# thread so the reply goes out without waiting on disk.
+_log_queue: Optional[queue.SimpleQueue] = None
 
 
 def _read_payload() -> str:
@@ -28,13 +50,48 @@ def _read_payload() -> str:
     return sys.stdin.read().strip()
 
 
-def _log_dir(root: Path) -> tuple[Path, str]:
+def _log_dir(root: Path, request_id: Optional[str] = None) -> tuple[Path, str]:
     out = root / "runtime" / "logs" / "picoclaw"
     out.mkdir(parents=True, exist_ok=True)
     run_id = f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    if request_id:
+        run_id = f"{run_id}_{request_id}"
     return out, run_id
 
 
+def _write_log(log_dir: Path, log_file: Path, records: list[dict]) -> None:
+    """Write a run's records in one go, then prune old runs if one is due."""
+    if _log_queue is not None:
+        _log_queue.put((log_dir, log_file, records))
+        return
+    _append_records(log_file, records)
+    _prune_logs(log_dir)
+
+
+def _append_records(log_file: Path, records: list[dict]) -> None:
+    with log_file.open("a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(record) + "\n" for record in records))
+
+
+def _prune_logs(log_dir: Path) -> None:
+    if LOG_KEEP_RUNS <= 0:
+        return
+    marker = log_dir / LOG_PRUNE_MARKER
+    try:
+        if time.time() - marker.stat().st_mtime < LOG_PRUNE_INTERVAL_SEC:
+            return
+    except FileNotFoundError:
+        pass
+    marker.touch()
+    # Run ids start with a UTC timestamp, so name order is age order.
+    logs = sorted(entry.name for entry in os.scandir(log_dir) if entry.name.endswith(".jsonl"))
+    for name in logs[: max(0, len(logs) - LOG_KEEP_RUNS)]:
+        try:
+            os.unlink(log_dir / name)
+        except OSError:
+            pass
+
+
 def _parse_command(payload: str) -> tuple[str, list[str]]:
     default_cmd = os.getenv("PICOCLAW_DEFAULT_COMMAND", "search").strip() or "search"
     if not payload:
@@ -55,20 +112,21 @@ def _parse_command(payload: str) -> tuple[str, list[str]]:
     return command, [str(item) for item in args]
 
 
-def main() -> int:
+def main(payload: Optional[str] = None, request_id: Optional[str] = None) -> int:
     root = Path(os.environ.get("HEIWA_WORKSPACE_ROOT", ".")).resolve()
-    log_dir, run_id = _log_dir(root)
-    payload = _read_payload()
+    log_dir, run_id = _log_dir(root, request_id)
+    if payload is None:
+        payload = _read_payload()
 
-    payload_file = log_dir / f"{run_id}.payload.txt"
-    payload_file.write_text(payload, encoding="utf-8")
     log_file = log_dir / f"{run_id}.jsonl"
+    records: list[dict] = []
 
     binary = os.getenv("PICOCLAW_BIN", "picoclaw")
     resolved = shutil.which(binary) if "/" not in binary else binary
     if not resolved:
         err = f"picoclaw binary not found (PICOCLAW_BIN={binary})"
-        log_file.write_text(json.dumps({"event": "ERROR", "error": err}) + "\n", encoding="utf-8")
+        records.append({"event": "ERROR", "error": err})
+        _write_log(log_dir, log_file, records)
         print(f"[ERR] {err}", file=sys.stderr)
         return 2
 
@@ -84,8 +142,13 @@ def main() -> int:
         
     cmd.extend(args)
 
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps({"event": "START", "run_id": run_id, "cmd": cmd}) + "\n")
+    records.append({
+        "event": "START",
+        "run_id": run_id,
+        "cmd": cmd,
+        "payload": payload[:LOG_PAYLOAD_CHARS],
+        "payload_chars": len(payload),
+    })
 
     try:
         result = subprocess.run(
@@ -96,28 +159,23 @@ def main() -> int:
             check=False,
         )
     except subprocess.TimeoutExpired:
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps({"event": "ERROR", "error": "TIMEOUT"}) + "\n")
+        records.append({"event": "ERROR", "error": "TIMEOUT"})
+        _write_log(log_dir, log_file, records)
         print("[ERR] picoclaw timed out", file=sys.stderr)
         return 3
     except Exception as exc:  # noqa: BLE001
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps({"event": "ERROR", "error": str(exc)}) + "\n")
+        records.append({"event": "ERROR", "error": str(exc)})
+        _write_log(log_dir, log_file, records)
         print(f"[ERR] picoclaw execution failed: {exc}", file=sys.stderr)
         return 4
 
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(
-            json.dumps(
-                {
-                    "event": "END",
-                    "returncode": result.returncode,
-                    "stdout_bytes": len(result.stdout or ""),
-                    "stderr_bytes": len(result.stderr or ""),
-                }
-            )
-            + "\n"
-        )
+    records.append({
+        "event": "END",
+        "returncode": result.returncode,
+        "stdout_bytes": len(result.stdout or ""),
+        "stderr_bytes": len(result.stderr or ""),
+    })
+    _write_log(log_dir, log_file, records)
 
     if result.stdout:
         print(result.stdout.strip())
@@ -127,5 +185,52 @@ def main() -> int:
     return int(result.returncode)
 
 
+def _log_writer(pending: queue.SimpleQueue) -> None:
+    """Drain queued runs until the ``None`` sentinel arrives."""
+    while True:
+        batch = [pending.get()]
+        while batch[-1] is not None and len(batch) < LOG_WRITE_BATCH:
+            try:
+                batch.append(pending.get_nowait())
+            except queue.Empty:
+                break
+        log_dirs = set()
+        for item in batch:
+            if item is None:
+                continue
+            log_dir, log_file, records = item
+            try:
+                _append_records(log_file, records)
+            except OSError as exc:
+                print(f"[WARN] picoclaw log write failed: {exc}", file=sys.stderr)
+            log_dirs.add(log_dir)
+        for log_dir in log_dirs:
+            try:
+                _prune_logs(log_dir)
+            except OSError:
+                pass
+        if batch[-1] is None:
+            return
+
+
+def serve() -> int:
+    """Answer {"id", "payload", "env"} lines until stdin closes."""
+    from _ndjson_serve import serve as serve_requests
+
+    global _log_queue
+    _log_queue = queue.SimpleQueue()
+    writer = threading.Thread(target=_log_writer, args=(_log_queue,), name="picoclaw-log", daemon=True)
+    writer.start()
+    try:
+        return serve_requests(lambda payload, request_id: main(payload.strip(), request_id))
+    finally:
+        # Flush whatever is still queued before the process exits.
+        _log_queue.put(None)
+        writer.join()
+        _log_queue = None
+
+
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--serve"]:
+        raise SystemExit(serve())
     raise SystemExit(main())
\ No newline at end of file
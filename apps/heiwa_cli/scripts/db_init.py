@@ -15,23 +15,23 @@ def init_db():
         conn = psycopg2.connect(database_url)
         cur = conn.cursor()
         
-        print("🛠️  Creating 'tasks' table if not exists...")
+        # Table and index go out as one multi-statement execute: a single
+        # round-trip to the server instead of one per DDL statement.
+        print("🛠️  Creating 'tasks' table and pending-queue index if not exists...")
         cur.execute("""
             CREATE TABLE IF NOT EXISTS tasks (
-                id SERIAL PRIMARY KEY,
+                id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
                 discord_msg_id VARCHAR(50),
                 source VARCHAR(50),
                 payload TEXT NOT NULL,
                 status VARCHAR(20) DEFAULT 'pending', -- pending, processing, completed, failed
                 result TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMPTZ DEFAULT NOW(),
+                updated_at TIMESTAMPTZ DEFAULT NOW()
             );
-        """)
-        
-        print("⚡ Creating index on 'status'...")
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_status ON tasks(status);
+            -- Partial index covering the sentinel's FIFO poll
+            -- (WHERE status = 'pending' ORDER BY created_at); finished rows stay out of it.
+            CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks(created_at) WHERE status = 'pending';
         """)
         
         conn.commit()
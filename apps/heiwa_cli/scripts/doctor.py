@@ -8,6 +8,7 @@ environment, and streaming prerequisites.
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import shutil
@@ -18,7 +19,8 @@ from urllib import request as urllib_request
 
 
 ROOT = Path(__file__).resolve().parent.parent.parent.parent
-sys.path.insert(0, str(ROOT))
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 
 def status_line(level: str, label: str, detail: str) -> None:
@@ -137,11 +139,20 @@ def check_env(file_env: dict[str, str], env_files: list[str]) -> int:
 
 def check_python_modules() -> int:
     failures = 0
+    # Each lookup stats every sys.path entry; drop repeats (ROOT is often
+    # already present via heiwa.pth or PYTHONPATH) so no directory is
+    # searched twice. sys.path_importer_cache then serves later lookups.
+    sys.path[:] = list(dict.fromkeys(sys.path))
     for mod in ("httpx", "websockets", "rich", "prompt_toolkit"):
+        # Locating the module is enough to prove it is installed; importing
+        # it would run its (and its dependencies') top-level code for nothing.
         try:
-            __import__(mod)
+            found = importlib.util.find_spec(mod) is not None
+        except (ImportError, ValueError):
+            found = False
+        if found:
             status_line("OK", "python-module", mod)
-        except Exception:
+        else:
             level = "FAIL" if mod in {"prompt_toolkit"} else "WARN"
             if level == "FAIL":
                 failures += 1
@@ -6,13 +6,19 @@ Ensures bot-related modules are syntactically valid and expected env hooks exist
 
 from __future__ import annotations
 
-import py_compile
+import functools
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[3]
 
 
+@functools.cache
+def read_source(path: Path) -> bytes:
+    """Each file is read once and shared by the compile and env-hook checks."""
+    return path.read_bytes()
+
+
 def compile_targets() -> list[str]:
     errors: list[str] = []
     targets = [
@@ -26,7 +32,9 @@ def compile_targets() -> list[str]:
             errors.append(f"missing file: {path.relative_to(ROOT)}")
             continue
         try:
-            py_compile.compile(str(path), doraise=True)
+            # Syntax check only: builtin compile() parses in memory and, unlike
+            # py_compile, writes no .pyc into __pycache__.
+            compile(read_source(path), str(path), "exec", dont_inherit=True)
         except Exception as exc:
             errors.append(f"{path.relative_to(ROOT)}: {exc}")
     return errors
@@ -43,7 +51,7 @@ def check_env_hooks() -> list[str]:
         if not path.exists():
             issues.append(f"missing file: {path.relative_to(ROOT)}")
             continue
-        text = path.read_text(encoding="utf-8")
+        text = read_source(path).decode("utf-8")
         for key in keys:
             if key not in text:
                 issues.append(f"{path.relative_to(ROOT)} missing env reference: {key}")
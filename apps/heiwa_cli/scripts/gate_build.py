@@ -7,24 +7,17 @@ Performs syntax and structure checks without external dependencies.
 from __future__ import annotations
 
 import py_compile
-import subprocess
 from pathlib import Path
 
+from _gitcache import tracked
+
 
 ROOT = Path(__file__).resolve().parents[2]
 
 
 def tracked_python_files() -> list[Path]:
     try:
-        result = subprocess.run(
-            ["git", "ls-files", "*.py"],
-            cwd=ROOT,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        files = [ROOT / line.strip() for line in result.stdout.splitlines() if line.strip()]
-        return files
+        return tracked(ROOT, "*.py")
     except Exception:
         return sorted(ROOT.rglob("*.py"))
 
@@ -7,41 +7,56 @@ Validates JSON/TOML and performs lightweight YAML text checks.
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _gitcache import tracked
+
 
 ROOT = Path(__file__).resolve().parents[3]
+# Files are read and checked on a small thread pool; map() keeps issue order.
+LINT_WORKERS = min(8, os.cpu_count() or 1)
 
 
 def git_files(*patterns: str) -> list[Path]:
-    files: list[Path] = []
-    for pattern in patterns:
-        result = subprocess.run(
-            ["git", "ls-files", pattern],
-            cwd=ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if line:
-                files.append(ROOT / line)
-    return files
+    # One ls-files listing for all pathspecs (shared with the other gates via
+    # _gitcache); a file matched by several patterns is listed once.
+    try:
+        return tracked(ROOT, *patterns)
+    except (subprocess.CalledProcessError, OSError):
+        return []
 
 
-def lint_json() -> list[str]:
+def _check_json(path: Path) -> list[str]:
+    try:
+        json.loads(path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        return [f"{path.relative_to(ROOT)} invalid JSON: {exc}"]
+    return []
+
+
+def _check_yaml(path: Path) -> list[str]:
     issues: list[str] = []
-    for path in git_files("*.json", "**/*.json"):
-        try:
-            json.loads(path.read_text(encoding="utf-8"))
-        except Exception as exc:
-            issues.append(f"{path.relative_to(ROOT)} invalid JSON: {exc}")
+    text = path.read_text(encoding="utf-8")
+    if "\t" in text:
+        issues.append(f"{path.relative_to(ROOT)} contains tab characters")
+    if text.strip() == "":
+        issues.append(f"{path.relative_to(ROOT)} is empty")
     return issues
 
 
+def _check_all(check, paths: list[Path]) -> list[str]:
+    with ThreadPoolExecutor(max_workers=LINT_WORKERS) as pool:
+        return [issue for found in pool.map(check, paths) for issue in found]
+
+
+def lint_json() -> list[str]:
+    return _check_all(_check_json, git_files("*.json", "**/*.json"))
+
+
 def lint_toml() -> list[str]:
     issues: list[str] = []
     for path in [ROOT / "pyproject.toml", ROOT / "railway.toml"]:
@@ -55,14 +70,7 @@ def lint_toml() -> list[str]:
 
 
 def lint_yaml_text() -> list[str]:
-    issues: list[str] = []
-    yaml_files = git_files("*.yaml", "*.yml", "**/*.yaml", "**/*.yml")
-    for path in yaml_files:
-        text = path.read_text(encoding="utf-8")
-        if "\t" in text:
-            issues.append(f"{path.relative_to(ROOT)} contains tab characters")
-        if text.strip() == "":
-            issues.append(f"{path.relative_to(ROOT)} is empty")
+    issues = _check_all(_check_yaml, git_files("*.yaml", "*.yml", "**/*.yaml", "**/*.yml"))
 
     config_candidates = [
         ROOT / "config/agents.yaml",
@@ -6,59 +6,92 @@ Detects obvious string-interpolated SQL patterns in Python code.
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
 import subprocess
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _gitcache import tracked
+
 
 ROOT = Path(__file__).resolve().parents[2]
 SQL_STATEMENT = re.compile(
     r"\b(SELECT\s+.+\s+FROM|INSERT\s+INTO|UPDATE\s+\w+\s+SET|DELETE\s+FROM)\b",
     re.IGNORECASE,
 )
+EXECUTE_CALL = b"execute("
+LINT_WORKERS = os.cpu_count() or 1
+# The boundaries str.splitlines() uses, so reported line numbers match it.
+LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 def tracked_python_files() -> list[Path]:
-    result = subprocess.run(
-        ["git", "ls-files", "*.py"],
-        cwd=ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    files = []
-    for line in result.stdout.splitlines():
-        line = line.strip()
-        if line:
-            files.append(ROOT / line)
-    return files
+    try:
+        return tracked(ROOT, "*.py")
+    except (subprocess.CalledProcessError, OSError):
+        return []
+
+
+def load_if_executes(path: Path) -> str | None:
+    """Decoded source of ``path`` if it mentions execute(, else ``None``.
+
+    The pre-check runs on a read-only mapping, so files without the call are
+    never copied or decoded; files with it are decoded from that same
+    mapping. Newlines are left untranslated: LINE_BREAK already splits on
+    CRLF and bare CR, so lines come out as read_text() would give them.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < len(EXECUTE_CALL):
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(EXECUTE_CALL) == -1:
+                return None
+            return mm[:].decode("utf-8", errors="replace")
 
 
 def lint_file(path: Path) -> list[str]:
+    # Only lines calling execute() are checked; most files have none.
+    text = load_if_executes(path)
+    if text is None:
+        return []
+    breaks = [(m.start(), m.end()) for m in LINE_BREAK.finditer(text)]
+    line_starts = [0] + [end for _, end in breaks]
+    line_ends = [start for start, _ in breaks] + [len(text)]
+
     issues: list[str] = []
-    lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-    for i, line in enumerate(lines, start=1):
-        normalized = line.strip()
-        if not normalized or normalized.startswith("#"):
-            continue
-        if "execute(" not in line:
-            continue
-        if "cursor.execute(" in line and "+" in line and SQL_STATEMENT.search(line):
-            issues.append(f"{path.relative_to(ROOT)}:{i} possible SQL concatenation in execute()")
-        if "f\"" in line or "f'" in line:
-            if SQL_STATEMENT.search(line) and "{" in line and "}" in line:
-                issues.append(f"{path.relative_to(ROOT)}:{i} possible f-string SQL interpolation")
-        if SQL_STATEMENT.search(line) and ".format(" in line:
-            issues.append(f"{path.relative_to(ROOT)}:{i} possible .format SQL interpolation")
-        if SQL_STATEMENT.search(line) and "%" in line and "%%" not in line and "logging" not in line:
-            issues.append(f"{path.relative_to(ROOT)}:{i} possible %-format SQL interpolation")
+    pos = text.find("execute(")
+    while pos != -1:
+        idx = bisect_right(line_starts, pos) - 1
+        issues.extend(lint_line(path, idx + 1, text[line_starts[idx]:line_ends[idx]]))
+        pos = text.find("execute(", line_ends[idx])
     return issues
 
 
-def main() -> int:
+def lint_line(path: Path, i: int, line: str) -> list[str]:
+    normalized = line.strip()
+    if not normalized or normalized.startswith("#"):
+        return []
+    if not SQL_STATEMENT.search(line):
+        return []
     issues: list[str] = []
-    for path in tracked_python_files():
-        issues.extend(lint_file(path))
+    if "cursor.execute(" in line and "+" in line:
+        issues.append(f"{path.relative_to(ROOT)}:{i} possible SQL concatenation in execute()")
+    if "f\"" in line or "f'" in line:
+        if "{" in line and "}" in line:
+            issues.append(f"{path.relative_to(ROOT)}:{i} possible f-string SQL interpolation")
+    if ".format(" in line:
+        issues.append(f"{path.relative_to(ROOT)}:{i} possible .format SQL interpolation")
+    if "%" in line and "%%" not in line and "logging" not in line:
+        issues.append(f"{path.relative_to(ROOT)}:{i} possible %-format SQL interpolation")
+    return issues
+
+
+def main() -> int:
+    with ThreadPoolExecutor(max_workers=LINT_WORKERS) as pool:
+        issues = [issue for found in pool.map(lint_file, tracked_python_files()) for issue in found]
 
     if issues:
         print("FAIL: lint_sql")
@@ -12,15 +12,19 @@ Validates:
 
 from __future__ import annotations
 
+import functools
+import http.client
 import os
 import socket
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.error import HTTPError
-from urllib.request import urlopen
+from urllib.parse import urljoin, urlsplit
 
 SMOKE_PREFIX = "HEIWA_SMOKE_PROBE:"
+# Redirect hops followed per health URL (urlopen used to follow them).
+MAX_REDIRECTS = 5
 
 
 def find_monorepo_root(start_path: Path) -> Path:
@@ -39,6 +43,16 @@ def say(level: str, label: str, detail: str) -> None:
     print(f"[{level}] {label}: {detail}")
 
 
+@functools.cache
+def dir_names(directory: Path) -> frozenset[str]:
+    """Entry names of ``directory`` from one listing; empty if unreadable."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 def cmd_ok(name: str) -> bool:
     import shutil
     return shutil.which(name) is not None
@@ -52,18 +66,68 @@ def tcp_open(host: str, port: int, timeout: float = 2.0) -> bool:
         return False
 
 
-def http_health(url: str, timeout: int = 5) -> tuple[bool, str]:
+def _request_status(conn: http.client.HTTPConnection, method: str, target: str) -> tuple[int, str | None]:
     try:
-        # Use HEAD if possible, fallback to GET
-        with urlopen(url, timeout=timeout) as resp:
-            code = getattr(resp, "status", 200)
+        conn.request(method, target, headers={"User-Agent": "Heiwa360/1.0"})
+        resp = conn.getresponse()
+        resp.read()
+    except (http.client.HTTPException, OSError):
+        # Leave the connection reusable: the next request reconnects.
+        conn.close()
+        raise
+    return resp.status, resp.getheader("Location")
+
+
+def http_health(url: str, timeout: int = 5, conns: dict | None = None) -> tuple[bool, str]:
+    """HEAD ``url`` (GET if HEAD is refused), following redirects.
+
+    ``conns`` maps (scheme, netloc) to an open connection so probes against
+    the same host share one TCP/TLS session.
+    """
+    own = conns is None
+    conns = {} if own else conns
+    method = "HEAD"
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.netloc)
+            conn = conns.get(key)
+            if conn is None:
+                conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                conn = conns[key] = conn_cls(parts.netloc, timeout=timeout)
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            try:
+                code, location = _request_status(conn, method, target)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A reused keep-alive socket may have been dropped by the
+                # server; retry once on a fresh connection.
+                code, location = _request_status(conn, method, target)
+            if code in {405, 501} and method == "HEAD":
+                method = "GET"
+                continue
+            if code in {301, 302, 303, 307, 308} and location:
+                url = urljoin(url, location)
+                continue
+            if code in {401, 403}:
+                return (True, f"HTTP {code} (protected)")
             return (200 <= code < 300, f"HTTP {code}")
-    except HTTPError as exc:
-        if exc.code in {401, 403}:
-            return (True, f"HTTP {exc.code} (protected)")
-        return (False, f"HTTP {exc.code}")
+        return (False, "too many redirects")
     except Exception as exc:
         return (False, str(exc))
+    finally:
+        if own:
+            for conn in conns.values():
+                conn.close()
+
+
+def http_health_group(urls: list[str], timeout: int = 5) -> list[tuple[bool, str]]:
+    """Probe URLs that share a host over one reused connection."""
+    conns: dict = {}
+    try:
+        return [http_health(url, timeout, conns) for url in urls]
+    finally:
+        for conn in conns.values():
+            conn.close()
 
 
 def maybe_run_smoke_probe(argv: list[str]) -> bool:
@@ -96,13 +160,11 @@ def main() -> int:
         warns += 1
 
     env_files = [".env.worker.local", ".env.worker", ".env"]
-    found_env = False
-    for ef in env_files:
-        if (ROOT / ef).exists():
-            say("OK", "file", ef)
-            found_env = True
-            break
-    if not found_env:
+    root_names = dir_names(ROOT)
+    chosen_env = next((ef for ef in env_files if ef in root_names), None)
+    if chosen_env:
+        say("OK", "file", chosen_env)
+    else:
         say("FAIL", "file", "missing base .env")
         fails += 1
 
@@ -117,9 +179,11 @@ def main() -> int:
         "apps/heiwa_cli/scripts/agents/wrappers/openclaw_exec.sh",
         "packages/heiwa_sdk/heiwa_sdk/db.py",
     ]
+    # One listing per parent directory (cached, shared with the env check)
+    # instead of a stat per file.
     for rel in remaining_critical:
         p = ROOT / rel
-        if p.exists():
+        if p.name in dir_names(p.parent):
             say("OK", "file", rel)
         else:
             say("FAIL", "file", f"missing {rel}")
@@ -133,14 +197,8 @@ def main() -> int:
             say("FAIL", "command", f"{cmd} missing")
             fails += 1
 
-    # 4. Local Services
-    if tcp_open("127.0.0.1", 11434):
-        say("OK", "service", "ollama listening on 127.0.0.1:11434")
-    else:
-        say("WARN", "service", "ollama not listening")
-        warns += 1
-
-    # 5. Cloud & Edge Health
+    # 4 & 5 are independent network probes: run them together so a dead
+    # host costs one timeout overall, then report in the usual order.
     health_urls = [
         "https://heiwa.ltd",
         "https://status.heiwa.ltd",
@@ -148,8 +206,27 @@ def main() -> int:
         "https://auth.heiwa.ltd/health",
         "https://heiwa-cloud-hq-brain.up.railway.app/health",
     ]
+    by_host: dict[tuple[str, str], list[str]] = {}
+    for url in health_urls:
+        parts = urlsplit(url)
+        by_host.setdefault((parts.scheme, parts.netloc), []).append(url)
+    with ThreadPoolExecutor(max_workers=len(by_host) + 1) as pool:
+        ollama_probe = pool.submit(tcp_open, "127.0.0.1", 11434)
+        host_probes = [pool.submit(http_health_group, urls) for urls in by_host.values()]
+    health = {}
+    for urls, probe in zip(by_host.values(), host_probes):
+        health.update(zip(urls, probe.result()))
+
+    # 4. Local Services
+    if ollama_probe.result():
+        say("OK", "service", "ollama listening on 127.0.0.1:11434")
+    else:
+        say("WARN", "service", "ollama not listening")
+        warns += 1
+
+    # 5. Cloud & Edge Health
     for url in health_urls:
-        ok, detail = http_health(url)
+        ok, detail = health[url]
         if ok:
             say("OK", "edge", f"{url} -> {detail}")
         else:
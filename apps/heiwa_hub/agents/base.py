@@ -18,6 +18,89 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AgentBase")
 
 
+class SystemSampler:
+    """Process-wide psutil snapshot, re-sampled at most once per ``ttl`` seconds.
+
+    Every agent runs its own heartbeat; they share one sampler so co-located
+    agents don't each hit /proc for the same numbers.
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._ts = 0.0
+        self._sample: Dict[str, float] = {}
+        try:
+            import psutil
+            # Prime the CPU counter so later non-blocking reads return the
+            # delta since this call instead of a meaningless 0.0.
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+
+    def sample(self) -> Dict[str, float]:
+        now = time.monotonic()
+        if not self._sample or now - self._ts > self.ttl:
+            import psutil
+            mem = psutil.virtual_memory()
+            self._sample = {
+                "cpu_pct": psutil.cpu_percent(interval=None),
+                "ram_pct": mem.percent,
+                "ram_used_gb": round(mem.used / (1024**3), 2),
+                "ram_total_gb": round(mem.total / (1024**3), 2),
+            }
+            self._ts = now
+        return self._sample
+
+
+SYSTEM_SAMPLER = SystemSampler()
+
+HEARTBEAT_INTERVAL_SEC = 30
+
+
+class HeartbeatDriver:
+    """Single periodic task that publishes heartbeats for every running agent.
+
+    Agents register on start; each tick takes one sampler snapshot and fans it
+    out, instead of every agent keeping its own sleep loop.
+    """
+
+    def __init__(self, sampler: SystemSampler, interval: float = HEARTBEAT_INTERVAL_SEC):
+        self.sampler = sampler
+        self.interval = interval
+        self._agents: list["BaseAgent"] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, agent: "BaseAgent") -> None:
+        if self._task is None or self._task.done():
+            # A finished driver may belong to an earlier event loop; its
+            # agents went with it.
+            self._agents.clear()
+            self._task = asyncio.create_task(self._run())
+        if agent not in self._agents:
+            self._agents.append(agent)
+
+    async def _run(self) -> None:
+        try:
+            import psutil  # noqa: F401 - the sampler needs it
+        except ImportError:
+            return
+        while self._agents:
+            sample = self.sampler.sample()
+            now = time.time()
+            for agent in list(self._agents):
+                if not agent.running:
+                    self._agents.remove(agent)
+                    continue
+                try:
+                    await agent._publish_heartbeat(sample, now)
+                except Exception as e:
+                    logger.debug("Telemetry heartbeat failed for %s: %s", agent.name, e)
+            await asyncio.sleep(self.interval)
+
+
+HEARTBEAT_DRIVER = HeartbeatDriver(SYSTEM_SAMPLER)
+
+
 class BaseAgent(ABC):
     """
     Abstract base for all Heiwa agents.
@@ -32,37 +115,28 @@ class BaseAgent(ABC):
         self.id = IDENTITY.get("uuid", "unknown")
         self.bus: LocalBusTransport = get_bus()
         self.running = False
+        # Set by shutdown(); run() loops park on it instead of polling.
+        self._stopped = asyncio.Event()
         self.vault = InstanceVault()
 
     async def start(self):
-        """Mark the agent as running and begin the heartbeat loop."""
+        """Mark the agent as running and join the shared heartbeat tick."""
         self.running = True
-        asyncio.create_task(self._telemetry_heartbeat())
+        self._stopped.clear()
+        HEARTBEAT_DRIVER.register(self)
         logger.info("[%s] Started on local bus.", self.name)
 
-    async def _telemetry_heartbeat(self):
-        """Broadcast node resource usage every 30 seconds."""
-        try:
-            import psutil
-        except ImportError:
-            return
-        while self.running:
-            try:
-                stats = {
-                    "node_id": self.id,
-                    "agent_name": self.name,
-                    "cpu_pct": psutil.cpu_percent(),
-                    "ram_pct": psutil.virtual_memory().percent,
-                    "ram_used_gb": round(psutil.virtual_memory().used / (1024**3), 2),
-                    "ram_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-                    "timestamp": time.time(),
-                    "status": "ONLINE",
-                }
-                await self.speak(Subject.NODE_HEARTBEAT, stats)
-                await self.speak(Subject.NODE_TELEMETRY, stats)
-            except Exception as e:
-                logger.debug("Telemetry heartbeat failed for %s: %s", self.name, e)
-            await asyncio.sleep(30)
+    async def _publish_heartbeat(self, sample: Dict[str, float], timestamp: float):
+        """Broadcast node resource usage; driven by HEARTBEAT_DRIVER."""
+        stats = {
+            "node_id": self.id,
+            "agent_name": self.name,
+            **sample,
+            "timestamp": timestamp,
+            "status": "ONLINE",
+        }
+        await self.speak(Subject.NODE_HEARTBEAT, stats)
+        await self.speak(Subject.NODE_TELEMETRY, stats)
 
     async def speak(self, subject: Subject, data: Dict[str, Any]):
         """Publish an event to the local bus."""
@@ -95,6 +169,7 @@ class BaseAgent(ABC):
     async def shutdown(self):
         """Graceful shutdown."""
         self.running = False
+        self._stopped.set()
         logger.info("[%s] Shutdown complete.", self.name)
 
 
@@ -119,8 +194,7 @@ class ProposalAgent(BaseAgent):
             self._handle_task,
         )
         logger.info("[%s] Active.", self.name)
-        while self.running:
-            await asyncio.sleep(1)
+        await self._stopped.wait()
 
     async def _handle_task(self, data: Dict[str, Any]):
         task_data: Dict[str, Any] = {}
@@ -18,6 +18,7 @@ from heiwa_hub.agents.base import BaseAgent
 from heiwa_protocol.protocol import Subject
 from heiwa_protocol.routing import BROKER_ENVELOPE_VERSION, BrokerRouteResult
 from heiwa_sdk import HeiwaClawGateway
+from heiwa_sdk.heiwaclaw import HeiwaClawDispatch
 from heiwa_sdk.db import Database
 
 logger = logging.getLogger("Executor")
@@ -30,6 +31,9 @@ class ExecutorAgent(BaseAgent):
         self.root = Path(__file__).resolve().parents[3]
         self.db = Database()
         self.gateway = HeiwaClawGateway(self.root)
+        # Bus callbacks run as independent tasks; cap how many executions overlap.
+        self.max_concurrency = max(1, int(os.getenv("HEIWA_EXECUTOR_CONCURRENCY", "4")))
+        self._slots = asyncio.Semaphore(self.max_concurrency)
 
     async def run(self):
         await self.start()
@@ -38,10 +42,16 @@ class ExecutorAgent(BaseAgent):
         await self.listen(Subject.TASK_EXEC_REQUEST_CODE, self._handle_exec)
         await self.listen(Subject.TASK_EXEC_REQUEST_RESEARCH, self._handle_exec)
 
-        logger.info("Executor active (%s). Awaiting directives...", self.executor_runtime)
+        logger.info(
+            "Executor active (%s, concurrency=%d). Awaiting directives...",
+            self.executor_runtime, self.max_concurrency,
+        )
+
+        await self._stopped.wait()
 
-        while self.running:
-            await asyncio.sleep(1)
+    async def shutdown(self):
+        await self.gateway.close()
+        await super().shutdown()
 
     async def _handle_exec(self, data: dict[str, Any]) -> None:
         payload = data.get("data", data)
@@ -77,6 +87,19 @@ class ExecutorAgent(BaseAgent):
         })
         dispatch = self.gateway.resolve(route)
 
+        async with self._slots:
+            await self._execute(payload, route, dispatch, task_id, instruction, intent_class, target_tool)
+
+    async def _execute(
+        self,
+        payload: dict[str, Any],
+        route: BrokerRouteResult,
+        dispatch: HeiwaClawDispatch,
+        task_id: str,
+        instruction: str,
+        intent_class: str,
+        target_tool: str,
+    ) -> None:
         logger.info("Processing task: %s | Intent: %s", task_id, intent_class)
         await self.speak(Subject.TASK_STATUS, {
             "accepted": True,
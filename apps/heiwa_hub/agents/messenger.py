@@ -4,6 +4,7 @@ import os
 import re
 import time
 import uuid
+from collections import OrderedDict
 from typing import Any, Optional, Dict, List, Union
 
 import discord
@@ -21,6 +22,13 @@ from heiwa_sdk.spacetimedb import SpacetimeDB
 
 logger = logging.getLogger("Messenger")
 _MISSING = object()
+# Reply routing is only needed while a task is in flight; keep the newest N.
+MAX_TASK_TARGETS = 1000
+# Channel ids only change on /sync; re-read the DB mapping at most this often.
+CHANNEL_ID_CACHE_TTL_SEC = 300.0
+# Channels whose messages are consumed without an explicit mention.
+COMMAND_CHANNEL_PURPOSES = ("operator-ingress", "central-comms", "operator-input", "central-command", "casual-brainstorm")
+ADMIN_ROLE_NAMES = frozenset({"admin", "operator", "heiwa admin"})
 
 STRUCTURE = {
     "👑 STRATEGIC HQ": {
@@ -104,6 +112,8 @@ class MessengerAgent(BaseAgent):
     def __init__(self):
         super().__init__(name="heiwa-messenger")
         self.db = Database()
+        self._channel_ids: dict[str, tuple[float, int]] = {}
+        self._command_ids: Optional[tuple[float, frozenset[int]]] = None
         self.token = os.getenv("DISCORD_TOKEN") or os.getenv("DISCORD_BOT_TOKEN")
         self.conversational_mode = os.getenv("HEIWA_CONVERSATIONAL_MODE", "true").lower() == "true"
         self.listen_channel_ids = self._parse_channel_ids(os.getenv("HEIWA_LISTEN_CHANNEL_IDS", ""))
@@ -113,7 +123,7 @@ class MessengerAgent(BaseAgent):
         self.channel_id = self._get_channel_id("operator-input") or self._get_channel_id("operator-ingress") or self._get_channel_id("central-comms") or self._get_channel_id("central-command")
 
         self.approval_timeout_sec = int(os.getenv("HEIWA_APPROVAL_TIMEOUT_SEC", "600"))
-        self.task_targets: dict[str, dict[str, int | None]] = {}
+        self.task_targets: OrderedDict[str, dict[str, int | None]] = OrderedDict()
         self.approvals = ApprovalRegistry(timeout_sec=self.approval_timeout_sec)
         self.planner = LocalTaskPlanner()
 
@@ -156,6 +166,15 @@ class MessengerAgent(BaseAgent):
             await interaction.response.send_message(embed=embed)
 
     def _get_channel_id(self, purpose: str) -> int:
+        now = time.monotonic()
+        hit = self._channel_ids.get(purpose)
+        if hit and now - hit[0] < CHANNEL_ID_CACHE_TTL_SEC:
+            return hit[1]
+        channel_id = self._lookup_channel_id(purpose)
+        self._channel_ids[purpose] = (now, channel_id)
+        return channel_id
+
+    def _lookup_channel_id(self, purpose: str) -> int:
         db_id = self.db.get_discord_channel(purpose)
         if db_id:
             try: return int(db_id)
@@ -263,14 +282,15 @@ class MessengerAgent(BaseAgent):
                 await channel.send(embed=embed)
 
     async def on_message(self, message: discord.Message):
-        if message.author == self.bot.user or message.author.bot:
+        author = message.author
+        if author.bot or (self.bot.user and author.id == self.bot.user.id):
             return
 
         # STDB Identity Trace: Record interaction for trust and context tracking
-        user_id = message.author.id
-        username = str(message.author)
+        user_id = author.id
+        username = str(author)
         # Admins get immediate trust tier 1.0 (Enterprise logic)
-        trust = 1.0 if any(role.name.lower() in ["admin", "operator", "heiwa admin"] for role in getattr(message.author, 'roles', [])) else 0.5
+        trust = 1.0 if any(role.name.lower() in ADMIN_ROLE_NAMES for role in getattr(author, 'roles', ())) else 0.5
         
         self.db.stdb.call("upsert_discord_user", user_id, username, trust)
         self.db.stdb.call("record_interaction", user_id, message.channel.id, "chat")
@@ -302,10 +322,15 @@ class MessengerAgent(BaseAgent):
         if message.guild is None: return True
         if self.bot.user and self.bot.user in message.mentions: return True
         # Routing endpoints (Casual chat & ingress)
-        command_purposes = {"operator-ingress", "central-comms", "operator-input", "central-command", "casual-brainstorm"}
-        command_ids = {self._get_channel_id(p) for p in command_purposes}
-        command_ids.discard(0)
-        return message.channel.id in command_ids
+        return message.channel.id in self._command_channel_ids()
+
+    def _command_channel_ids(self) -> frozenset[int]:
+        now = time.monotonic()
+        if self._command_ids and now - self._command_ids[0] < CHANNEL_ID_CACHE_TTL_SEC:
+            return self._command_ids[1]
+        ids = frozenset(self._get_channel_id(p) for p in COMMAND_CHANNEL_PURPOSES) - {0}
+        self._command_ids = (now, ids)
+        return ids
 
     def _clean_instruction(self, raw: str) -> str:
         if self.bot.user: raw = re.sub(rf"<@!?{self.bot.user.id}>", "", raw)
@@ -338,6 +363,8 @@ class MessengerAgent(BaseAgent):
                             await channel.edit(sync_permissions=True)
                         self.db.upsert_discord_channel(chan_name, channel.id, category_name=cat_name)
             
+            self._channel_ids.clear()
+            self._command_ids = None
             embed.title = "✅ Swarm Structure Synchronized"
             embed.description = "Canonical enterprise structure applied and indexed."
             embed.color = UIManager.COLORS["executing"]
@@ -403,6 +430,8 @@ class MessengerAgent(BaseAgent):
             "channel_id": int(response_channel_id) if response_channel_id else None, 
             "thread_id": int(response_thread_id) if response_thread_id else None
         }
+        while len(self.task_targets) > MAX_TASK_TARGETS:
+            self.task_targets.popitem(last=False)
         await self._publish_raw(Subject.TASK_PLAN_RESULT.value, plan_payload)
 
         plan_embed = UIManager.create_task_embed(task_id, instruction, status="thinking")
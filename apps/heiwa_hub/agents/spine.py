@@ -2,6 +2,7 @@ import asyncio
 import logging
 import time
 import uuid
+from collections import OrderedDict
 from typing import Dict
 
 from heiwa_hub.agents.base import BaseAgent
@@ -15,15 +16,23 @@ from heiwa_protocol.routing import BROKER_ENVELOPE_VERSION, BrokerRouteRequest,
 
 logger = logging.getLogger("Spine")
 
+_STATUS = Subject.TASK_STATUS
+_EXEC = Subject.TASK_EXEC
+_EXEC_SUBJECT = Subject.TASK_EXEC.value
+# Runtimes served by the in-process executor unless a worker is assigned.
+_LOCAL_RUNTIMES = frozenset(("railway", "cloud"))
+
 
 class SpineAgent(BaseAgent):
     def __init__(self):
         super().__init__(name="heiwa-spine")
-        self.fleet_registry: Dict[str, float] = {}
+        # Oldest heartbeat first, so pruning stops at the first live node.
+        self.fleet_registry: OrderedDict[str, float] = OrderedDict()
         self.planner = LocalTaskPlanner()
         self.enrichment = BrokerEnrichmentService()
         self.approvals = get_approval_registry()
         self._approval_timers: Dict[str, asyncio.Task] = {}
+        self._maintenance_timer: asyncio.TimerHandle | None = None
 
     async def run(self):
         await self.start()
@@ -35,22 +44,38 @@ class SpineAgent(BaseAgent):
 
         logger.info("Spine active. Monitoring fleet...")
 
+        # Bus callbacks drive all work; fleet/approval upkeep rides a loop timer.
+        self._maintenance_timer = asyncio.get_running_loop().call_later(10, self._maintenance_tick)
         try:
-            while self.running:
-                self._prune_registry()
-                self.approvals.prune()
-                if self.fleet_registry:
-                    logger.info("Fleet: %d active node(s).", len(self.fleet_registry))
-                await asyncio.sleep(10)
+            await self._stopped.wait()
         except KeyboardInterrupt:
             await self.shutdown()
 
+    def _maintenance_tick(self):
+        if not self.running:
+            return
+        try:
+            self._prune_registry()
+            self.approvals.prune()
+            if self.fleet_registry:
+                logger.info("Fleet: %d active node(s).", len(self.fleet_registry))
+        except Exception as e:
+            logger.error("Spine maintenance failed: %s", e)
+        self._maintenance_timer = asyncio.get_running_loop().call_later(10, self._maintenance_tick)
+
+    async def shutdown(self):
+        if self._maintenance_timer is not None:
+            self._maintenance_timer.cancel()
+            self._maintenance_timer = None
+        await super().shutdown()
+
     async def handle_heartbeat(self, data: dict):
         sender = data.get("sender_id")
         if sender:
             if sender not in self.fleet_registry:
                 logger.info("New node detected: %s", sender)
             self.fleet_registry[sender] = time.time()
+            self.fleet_registry.move_to_end(sender)
 
     async def handle_request(self, data: dict):
         """Receive a task envelope, verify auth, enrich via broker, dispatch."""
@@ -66,7 +91,7 @@ class SpineAgent(BaseAgent):
         auth_token = extract_auth_token(data)
         if not auth_token or auth_token != expected_token:
             logger.warning("Digital Barrier: invalid token from %s", sender_id)
-            await self.speak(Subject.TASK_STATUS, {
+            await self.speak(_STATUS, {
                 "accepted": False,
                 "reason": "Invalid or missing auth token.",
                 "task_id": data.get("task_id", data.get("data", {}).get("task_id", "unknown")),
@@ -119,7 +144,7 @@ class SpineAgent(BaseAgent):
                 payload["steps"] = [{
                     "step_id": "fallback-exec",
                     "instruction": payload.get("raw_text"),
-                    "subject": Subject.TASK_EXEC.value,
+                    "subject": _EXEC_SUBJECT,
                     "target_runtime": "any",
                 }]
                 dispatch_status_code = "DISPATCHED_FALLBACK"
@@ -145,7 +170,7 @@ class SpineAgent(BaseAgent):
                 steps = [{
                     "step_id": "auto-reflex",
                     "instruction": raw_text,
-                    "subject": Subject.TASK_EXEC.value,
+                    "subject": _EXEC_SUBJECT,
                     "target_runtime": "any",
                     "target_tool": "heiwa_claw",
                 }]
@@ -257,41 +282,52 @@ class SpineAgent(BaseAgent):
         dispatch_status_code: str,
     ) -> None:
         steps = payload.get("steps") or []
+        wm = get_worker_manager()
+        # Task-level fields are read once; steps only override what they carry.
+        exec_base = {
+            "task_id": task_id,
+            "plan_id": payload.get("plan_id"),
+            "approval_id": payload.get("approval_id"),
+            "step_id": None,
+            "instruction": payload.get("raw_text", ""),
+            "intent_class": payload.get("intent_class", intent),
+            "risk_level": payload.get("risk_level"),
+            "privacy_level": payload.get("privacy_level"),
+            "requested_by": payload.get("requested_by"),
+            "target_runtime": payload.get("target_runtime", "railway"),
+            "target_tool": payload.get("target_tool", "heiwa_claw"),
+            "target_model": payload.get("target_model", ""),
+            "target_tier": payload.get("target_tier"),
+            "compute_class": payload.get("compute_class"),
+            "assigned_worker": payload.get("assigned_worker"),
+            "requires_approval": payload.get("requires_approval"),
+            "response_channel_id": payload.get("response_channel_id"),
+            "response_thread_id": payload.get("response_thread_id"),
+            "raw_text": payload.get("raw_text"),
+            "normalization": payload.get("normalization"),
+            "envelope_version": payload.get("envelope_version"),
+        }
+        status_context = self._status_context(payload)
         for step in steps:
             if not isinstance(step, dict):
                 continue
             step_id = str(step.get("step_id", "unknown"))
 
             exec_payload = {
-                "task_id": task_id,
-                "plan_id": payload.get("plan_id"),
-                "approval_id": payload.get("approval_id"),
+                **exec_base,
                 "step_id": step_id,
-                "instruction": step.get("instruction", payload.get("raw_text", "")),
-                "intent_class": payload.get("intent_class", intent),
-                "risk_level": payload.get("risk_level"),
-                "privacy_level": payload.get("privacy_level"),
-                "requested_by": payload.get("requested_by"),
-                "target_runtime": step.get("target_runtime", payload.get("target_runtime", "railway")),
-                "target_tool": step.get("target_tool", payload.get("target_tool", "heiwa_claw")),
-                "target_model": step.get("target_model", payload.get("target_model", "")),
-                "target_tier": step.get("target_tier", payload.get("target_tier")),
-                "compute_class": payload.get("compute_class"),
-                "assigned_worker": payload.get("assigned_worker"),
-                "requires_approval": payload.get("requires_approval"),
-                "response_channel_id": payload.get("response_channel_id"),
-                "response_thread_id": payload.get("response_thread_id"),
-                "raw_text": payload.get("raw_text"),
-                "normalization": payload.get("normalization"),
-                "envelope_version": payload.get("envelope_version"),
+                "instruction": step.get("instruction", exec_base["instruction"]),
+                "target_runtime": step.get("target_runtime", exec_base["target_runtime"]),
+                "target_tool": step.get("target_tool", exec_base["target_tool"]),
+                "target_model": step.get("target_model", exec_base["target_model"]),
+                "target_tier": step.get("target_tier", exec_base["target_tier"]),
             }
 
             # Try remote worker if task targets a non-Railway runtime
             dispatched_remote = False
             target_rt = exec_payload.get("target_runtime", "railway")
             assigned = exec_payload.get("assigned_worker")
-            if target_rt not in {"railway", "cloud"} or assigned:
-                wm = get_worker_manager()
+            if target_rt not in _LOCAL_RUNTIMES or assigned:
                 worker_id = assigned or wm.get_worker_for_runtime(target_rt)
                 if worker_id:
                     pushed = await wm.push_task(worker_id, exec_payload)
@@ -300,7 +336,7 @@ class SpineAgent(BaseAgent):
                         logger.info("Dispatched %s/%s to remote worker %s", task_id, step_id, worker_id)
 
             if not dispatched_remote:
-                await self.speak(Subject.TASK_EXEC, exec_payload)
+                await self.speak(_EXEC, exec_payload)
                 logger.info("Dispatched %s/%s to local executor", task_id, step_id)
 
             await self._emit_task_status(
@@ -310,6 +346,7 @@ class SpineAgent(BaseAgent):
                 status=dispatch_status_code,
                 message=f"Spine dispatched step {step_id}.",
                 accepted=True,
+                context=status_context,
             )
 
     def _requires_manual_approval(self, payload: dict) -> bool:
@@ -386,8 +423,9 @@ class SpineAgent(BaseAgent):
         message: str,
         accepted: bool,
         reason: str | None = None,
+        context: dict | None = None,
     ) -> None:
-        await self.speak(Subject.TASK_STATUS, {
+        await self.speak(_STATUS, {
             "accepted": accepted,
             "reason": reason,
             "task_id": task_id,
@@ -395,10 +433,16 @@ class SpineAgent(BaseAgent):
             "status": status,
             "message": message,
             "runtime": "spine",
+            **(context if context is not None else self._status_context(payload)),
+        })
+
+    @staticmethod
+    def _status_context(payload: dict) -> dict:
+        return {
             "response_channel_id": payload.get("response_channel_id"),
             "response_thread_id": payload.get("response_thread_id"),
             "approval_id": payload.get("approval_id"),
-        })
+        }
 
     @staticmethod
     def _payload_is_approved(payload: dict) -> bool:
@@ -430,13 +474,20 @@ class SpineAgent(BaseAgent):
 
     def _prune_registry(self):
         now = time.time()
-        dead = [nid for nid, last_seen in self.fleet_registry.items() if now - last_seen > 30.0]
-        for nid in dead:
+        while self.fleet_registry:
+            nid, last_seen = next(iter(self.fleet_registry.items()))
+            if now - last_seen <= 30.0:
+                break
+            self.fleet_registry.popitem(last=False)
             logger.warning("Node lost: %s", nid)
-            del self.fleet_registry[nid]
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     agent = SpineAgent()
     try:
         asyncio.run(agent.run())
@@ -30,8 +30,9 @@ class TelemetryAgent(BaseAgent):
         await self.listen(Subject.TASK_EXEC_RESULT, self.handle_exec_result)
         await self.listen(Subject.TASK_STATUS, self.handle_status)
         await self.listen(Subject.SWARM_STATUS_QUERY, self.handle_status_query)
+        # BaseAgent publishes each stats sample on both NODE_HEARTBEAT and
+        # NODE_TELEMETRY; persisting one copy is enough.
         await self.listen(Subject.NODE_HEARTBEAT, self.handle_node_heartbeat)
-        await self.listen(Subject.NODE_TELEMETRY, self.handle_node_heartbeat)
         
         logger.info("📊 Telemetry Agent Active. Monitoring Swarm Usage...")
 
@@ -194,5 +195,10 @@ class TelemetryAgent(BaseAgent):
         return {"input": 0, "output": 0, "total": 0}
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     agent = TelemetryAgent()
     asyncio.run(agent.run())
@@ -14,6 +14,13 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(level
 logger = logging.getLogger("TestAgent")
 
 class HeartbeatAgent(BaseAgent):
+    # The pulse never changes, so one dict is shared by every heartbeat.
+    PULSE = {
+        "cpu": "nominal",  # Placeholder for real stats
+        "memory": "nominal",
+        "task": "idling",
+    }
+
     async def run(self):
         await self.start()
 
@@ -25,15 +32,8 @@ class HeartbeatAgent(BaseAgent):
         logger.info("💓 Heartbeat Protocol Initiated.")
         try:
             while self.running:
-                # Construct status data
-                status = {
-                    "cpu": "nominal", # Placeholder for real stats
-                    "memory": "nominal",
-                    "task": "idling"
-                }
-                
                 # Speak to the network
-                await self.speak(Subject.NODE_HEARTBEAT, status)
+                await self.speak(Subject.NODE_HEARTBEAT, self.PULSE)
                 
                 # Wait 5 seconds
                 await asyncio.sleep(5)
@@ -45,6 +45,11 @@ class HeartbeatAgent(BaseAgent):
         logger.info(f"📨 RECEIVED DISPATCH: {data}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     # Bootstrap and run
     agent = HeartbeatAgent(name="Alpha-Test-Node")
     try:
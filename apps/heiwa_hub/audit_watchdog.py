@@ -16,7 +16,7 @@ class AuditWatchdog:
 
     async def check_audits(self):
         """Polls the DB for recent COMMAND_AUDIT alerts."""
-        db = Dispatcher.get_db()
+        db = await Dispatcher.get_db_async()
         try:
             # We query the alerts table for COMMAND_AUDIT kind
             with db.get_connection() as conn:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 import re
 from typing import Any
 
@@ -23,6 +24,9 @@ INTENT_ENUM = {
     "chat",
     "general",
 }
+# Normalized utterances whose profiles each normalizer keeps, oldest evicted first.
+NORMALIZE_CACHE_SIZE = 1024
+
 RISK_ENUM = {"low", "medium", "high", "critical"}
 RUNTIME_ENUM = {"railway", "macbook", "both"}
 TOOL_ENUM = {
@@ -68,6 +72,21 @@ _INTENT_RULES = (
     ("status_check", ("how are we", "how are things", "what's the status", "status update", "health check", "system status", "uptime", "pulse"), "low", False),
 )
 
+# One case-insensitive alternation per rule, bounded by non-word characters so
+# "meeting notes" style phrases match while substrings inside words do not.
+_INTENT_PATTERNS = tuple(
+    (
+        intent,
+        re.compile(
+            r"(?<!\w)(?:" + "|".join(re.escape(word) for word in keywords) + r")(?!\w)",
+            re.IGNORECASE,
+        ),
+        risk,
+        approval,
+    )
+    for intent, keywords, risk, approval in _INTENT_RULES
+)
+
 _INTENT_DEFAULTS = {
     "status_check": ("railway", "heiwa_ops", "tier1_local"),
     "mesh_ops": ("macbook", "heiwa_ops", "tier3_orchestrator"),
@@ -142,17 +161,39 @@ class IntentNormalizer:
 
     def __init__(self, engine: LocalLLMEngine | None = None) -> None:
         self.engine = engine
+        # Exact-match cache per normalizer so repeated utterances skip the rules and LLM pass.
+        self._profiles: OrderedDict[str, IntentProfile] = OrderedDict()
 
     def normalize(self, raw_text: str) -> IntentProfile:
         text = " ".join((raw_text or "").split()).strip()
         if not text:
             text = "handle this task with safe defaults"
+        profile = self._profiles.get(text)
+        if profile is not None:
+            self._profiles.move_to_end(text)
+        else:
+            profile, cacheable = self._normalize_text(text)
+            if cacheable:
+                self._profiles[text] = profile
+                if len(self._profiles) > NORMALIZE_CACHE_SIZE:
+                    self._profiles.popitem(last=False)
+        # Callers may mutate the profile, so hand out a copy of the cached one.
+        return replace(
+            profile,
+            assumptions=list(profile.assumptions),
+            missing_details=list(profile.missing_details),
+        )
+
+    def _normalize_text(self, text: str) -> tuple[IntentProfile, bool]:
+        """Build the profile for ``text``; the flag is False for the degraded
+        fallback taken when the LLM is unavailable, which must not be cached."""
 
         # Phase 4 Optimization: Regex Triage First (Zero Cost)
         inferred = self._infer_with_rules(text)
         intent = inferred["intent_class"]
         
         # Only burn API quota if the regex wall fails to classify it (general)
+        cacheable = True
         if intent == "general":
             llm = self._infer_with_llm(text)
             if llm:
@@ -168,6 +209,7 @@ class IntentNormalizer:
                 requires_approval = inferred["requires_approval"]
                 runtime, tool, tier = _INTENT_DEFAULTS[intent]
                 confidence = 0.50
+                cacheable = False
         else:
             risk = inferred["risk_level"]
             requires_approval = inferred["requires_approval"]
@@ -187,7 +229,7 @@ class IntentNormalizer:
             missing=missing,
         )
 
-        return IntentProfile(
+        profile = IntentProfile(
             intent_class=intent,
             risk_level=risk,
             requires_approval=requires_approval,
@@ -200,11 +242,11 @@ class IntentNormalizer:
             confidence=confidence,
             underspecified=underspecified,
         )
+        return profile, cacheable
 
     def _infer_with_rules(self, text: str) -> dict[str, Any]:
-        lowered = text.lower()
-        for intent, keywords, risk, approval in _INTENT_RULES:
-            if any(self._keyword_match(lowered, word) for word in keywords):
+        for intent, pattern, risk, approval in _INTENT_PATTERNS:
+            if pattern.search(text):
                 return {
                     "intent_class": intent,
                     "risk_level": risk,
@@ -216,19 +258,6 @@ class IntentNormalizer:
             "requires_approval": False,
         }
 
-    @staticmethod
-    def _keyword_match(lowered_text: str, keyword: str) -> bool:
-        token = str(keyword or "").strip().lower()
-        if not token:
-            return False
-        if " " in token:
-            # Phrase match with non-word boundaries so "meeting notes" works while
-            # avoiding substring collisions inside larger words.
-            pattern = rf"(?<!\w){re.escape(token)}(?!\w)"
-            return re.search(pattern, lowered_text) is not None
-        pattern = rf"\b{re.escape(token)}\b"
-        return re.search(pattern, lowered_text) is not None
-
     def _infer_with_llm(self, text: str) -> dict[str, Any]:
         if not self.engine or not self.engine.is_available("railway"):
             return {}
@@ -17,10 +17,12 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -28,6 +30,8 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from heiwa_sdk import fastjson
+
 try:
     from heiwa_sdk.heiwa_net import HeiwaNetProxy
     _NET_PROXY = HeiwaNetProxy(origin_surface="runtime", agent_id="llm-engine")
@@ -61,6 +65,11 @@ class LocalLLMEngine:
     def __init__(self) -> None:
         self.host_runtime = self._detect_host_runtime()
 
+        # One keep-alive pool per engine instead of a TCP/TLS handshake per call.
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
         # --- Ollama (Tier 1: Free, local inference) ---
         self.ollama_url = os.getenv(
             "HEIWA_OLLAMA_URL", "http://127.0.0.1:11434"
@@ -120,6 +129,10 @@ class LocalLLMEngine:
             "ON" if self.openai_key else "OFF",
         )
 
+    def close(self) -> None:
+        """Release pooled provider connections."""
+        self._http.close()
+
     # ------------------------------------------------------------------ #
     #  Availability checks                                                 #
     # ------------------------------------------------------------------ #
@@ -164,7 +177,7 @@ class LocalLLMEngine:
                     timeout=int(self.ollama_timeout),
                 )
             else:
-                resp = requests.get(
+                resp = self._http.get(
                     f"{self.ollama_url}/api/tags", timeout=self.ollama_timeout
                 )
             return resp.status_code == 200
@@ -193,19 +206,37 @@ class LocalLLMEngine:
         payload: dict[str, Any] = {
             "model": self.ollama_model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
         }
         if system:
             payload["system"] = system
 
-        resp = requests.post(
+        # Stream NDJSON chunks so the reply is assembled piecewise rather than
+        # buffered as one response body. The requests timeout only bounds each
+        # read, so the whole reply is held to ollama_timeout separately.
+        deadline = time.monotonic() + self.ollama_timeout
+        parts: list[str] = []
+        with self._http.post(
             f"{self.ollama_url}/api/generate",
             json=payload,
             timeout=self.ollama_timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        text = str(data.get("response") or "").strip()
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = fastjson.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                parts.append(str(chunk.get("response") or ""))
+                if chunk.get("done"):
+                    break
+                if time.monotonic() > deadline:
+                    raise requests.exceptions.Timeout(
+                        f"Ollama reply exceeded {self.ollama_timeout:g}s"
+                    )
+        text = "".join(parts).strip()
         return LLMResult(
             text=text, provider="ollama-local-http", model=self.ollama_model, tier=1
         )
@@ -240,13 +271,13 @@ class LocalLLMEngine:
                 timeout=int(self.gemini_timeout),
             )
         else:
-            resp = requests.post(url, json=payload, timeout=self.gemini_timeout)
+            resp = self._http.post(url, json=payload, timeout=self.gemini_timeout)
         if resp.status_code == 429:
             logger.warning("Gemini 429 on %s — backing off", model_name)
             resp.raise_for_status()
         resp.raise_for_status()
 
-        data = resp.json()
+        data = fastjson.loads(resp.content)
         text = ""
         if "candidates" in data and data["candidates"]:
             text = str(
@@ -287,7 +318,7 @@ class LocalLLMEngine:
                 timeout=int(self.anthropic_timeout),
             )
         else:
-            resp = requests.post(
+            resp = self._http.post(
                 url, json=payload, headers=headers, timeout=self.anthropic_timeout
             )
         if resp.status_code == 429:
@@ -295,7 +326,7 @@ class LocalLLMEngine:
             resp.raise_for_status()
         resp.raise_for_status()
 
-        data = resp.json()
+        data = fastjson.loads(resp.content)
         content = data.get("content") or []
         text_parts = [
             str(chunk.get("text", "")).strip()
@@ -338,7 +369,7 @@ class LocalLLMEngine:
                 timeout=int(self.openai_timeout),
             )
         else:
-            resp = requests.post(
+            resp = self._http.post(
                 url, json=payload, headers=headers, timeout=self.openai_timeout
             )
         if resp.status_code == 429:
@@ -346,7 +377,7 @@ class LocalLLMEngine:
             resp.raise_for_status()
         resp.raise_for_status()
 
-        data = resp.json()
+        data = fastjson.loads(resp.content)
         text = data["choices"][0]["message"]["content"].strip()
         return LLMResult(
             text=text, provider="openai", model=self.openai_model, tier=4
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import copy
 import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
@@ -15,9 +15,18 @@ from heiwa_hub.cognition.intent_normalizer import (
     IntentProfile,
 )
 from heiwa_hub.cognition.llm_local import LLMPolicyError, LocalLLMEngine
+from heiwa_protocol.protocol import Subject
+
+_ROOT = Path(__file__).resolve().parents[3]
+_SCHEMA_CANDIDATES = (
+    _ROOT / "config" / "schemas" / "task_envelope_v2.schema.json",
+    _ROOT / "schemas" / "task_envelope_v2.schema.json",
+)
+_SCHEMA_PATH = next((path for path in _SCHEMA_CANDIDATES if path.exists()), _SCHEMA_CANDIDATES[0])
+_SUBJECT_TASK_EXEC = Subject.TASK_EXEC.value
 
 
-@dataclass
+@dataclass(slots=True)
 class StepPlan:
     step_id: str
     title: str
@@ -29,7 +38,7 @@ class StepPlan:
     required_capability: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskPlan:
     task_id: str
     parent_task_id: str
@@ -56,16 +65,23 @@ class TaskPlan:
         return payload
 
 
+# status_check is fully static apart from its step_id, so it is cloned from a template.
+_STATUS_TEMPLATE = StepPlan(
+    step_id="",
+    title="Mesh Pulse Diagnostic",
+    instruction="Analyze the current mesh health and report status.",
+    subject=_SUBJECT_TASK_EXEC,
+    target_runtime="railway",
+    target_tool="heiwa_ops",
+    target_tier="tier1_local",
+)
+
+
 class LocalTaskPlanner:
     """Produces schema-like execution plans from free-form text."""
 
     def __init__(self) -> None:
-        root = Path(__file__).resolve().parents[3]
-        candidates = [
-            root / "config" / "schemas" / "task_envelope_v2.schema.json",
-            root / "schemas" / "task_envelope_v2.schema.json",
-        ]
-        self.schema_path = next((path for path in candidates if path.exists()), candidates[0])
+        self.schema_path = _SCHEMA_PATH
         self.engine: LocalLLMEngine | None = None
         try:
             self.engine = LocalLLMEngine()
@@ -149,42 +165,28 @@ class LocalTaskPlanner:
         # Tool validation skipped for dynamic tool mesh localization
 
     def _build_steps(self, profile: IntentProfile, raw_text: str) -> list[StepPlan]:
-        now = int(time.time() * 1000)
-        step_num = 0
+        # Every intent currently yields a single step; multi-step plans should
+        # number further steps from an itertools.count(2).
+        step_id = f"step-{int(time.time() * 1000)}-1"
         instruction = profile.normalized_instruction
         steps: list[StepPlan] = []
 
-        from heiwa_protocol.protocol import Subject
-
-        def next_step_id() -> str:
-            nonlocal step_num
-            step_num += 1
-            return f"step-{now}-{step_num}"
-
         intent = profile.intent_class
 
         # --- Mesh & Management: High-level 'Magic' actions ---
         if intent == "status_check":
-            steps.append(
-                StepPlan(
-                    step_id=next_step_id(),
-                    title="Mesh Pulse Diagnostic",
-                    instruction="Analyze the current mesh health and report status.",
-                    subject=Subject.TASK_EXEC.value,
-                    target_runtime="railway",
-                    target_tool="heiwa_ops",
-                    target_tier="tier1_local",
-                )
-            )
+            step = copy.copy(_STATUS_TEMPLATE)
+            step.step_id = step_id
+            steps.append(step)
             return steps
 
         if intent == "mesh_ops":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Sovereign Mesh Audit",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="macbook",
                     target_tool="heiwa_ops",
                     target_tier="tier3_orchestrator",
@@ -195,10 +197,10 @@ class LocalTaskPlanner:
         if intent == "self_buff":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Native Self-Improvement Sequence",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="macbook",
                     target_tool="heiwa_claw",
                     target_tier="tier5_heavy_code",
@@ -209,10 +211,10 @@ class LocalTaskPlanner:
         if intent == "audit":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Audit and validation pass",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="both",
                     target_tool="heiwa_ops",
                     target_tier="tier1_local",
@@ -225,10 +227,10 @@ class LocalTaskPlanner:
         if intent == "build":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Implement code changes",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime=profile.preferred_runtime,
                     target_tool="heiwa_claw",
                     target_tier=profile.preferred_tier,
@@ -240,10 +242,10 @@ class LocalTaskPlanner:
         if intent in {"operate", "deploy"}:
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Operational change execution",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="railway",
                     target_tool="heiwa_ops",
                     target_tier=profile.preferred_tier,
@@ -255,10 +257,10 @@ class LocalTaskPlanner:
         if intent == "research":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Gather and synthesize findings",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="railway",
                     target_tool="heiwa_claw",
                     target_tier=profile.preferred_tier,
@@ -270,10 +272,10 @@ class LocalTaskPlanner:
         if intent == "strategy":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Strategic analysis and proposal",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="railway",
                     target_tool="heiwa_claw",
                     target_tier=profile.preferred_tier,
@@ -285,10 +287,10 @@ class LocalTaskPlanner:
         if intent == "media":
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Media generation or transformation",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="both",
                     target_tool="heiwa_claw",
                     target_tier=profile.preferred_tier,
@@ -300,10 +302,10 @@ class LocalTaskPlanner:
         if intent in {"automate", "automation"}:
             steps.append(
                 StepPlan(
-                    step_id=next_step_id(),
+                    step_id=step_id,
                     title="Automation and scheduler work",
                     instruction=instruction,
-                    subject=Subject.TASK_EXEC.value,
+                    subject=_SUBJECT_TASK_EXEC,
                     target_runtime="railway",
                     target_tool="heiwa_ops",
                     target_tier=profile.preferred_tier,
@@ -315,10 +317,10 @@ class LocalTaskPlanner:
         # --- Default: general orchestration via Railway LLM ---
         steps.append(
             StepPlan(
-                step_id=next_step_id(),
+                step_id=step_id,
                 title="General orchestration response",
                 instruction=instruction,
-                subject=Subject.TASK_EXEC.value,
+                subject=_SUBJECT_TASK_EXEC,
                 target_runtime="railway",
                 target_tool="heiwa_claw",
                 target_tier=profile.preferred_tier,
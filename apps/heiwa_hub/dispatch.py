@@ -1,18 +1,25 @@
+import asyncio
 import os
-import json
-from datetime import datetime, timezone, timedelta
+import logging
+import time
+from datetime import datetime, timezone
 
 from heiwa_identity.node import load_node_identity, get_tailscale_ip
 from heiwa_protocol.protocol import Subject, Payload
 
 IDENTITY = load_node_identity()
 TAILSCALE_IP = get_tailscale_ip()
+_NODE_NAME = IDENTITY.get("name")
+_DETAILS_BASE = {"node": _NODE_NAME, "ip": TAILSCALE_IP}
 from heiwa_sdk.db import Database
 
+logger = logging.getLogger("Hub.Dispatch")
+
 class Dispatcher:
     """Handles the handoff between Discord commands and remote execution targets."""
     
     _db = None
+    _db_lock = asyncio.Lock()
 
     @classmethod
     def get_db(cls):
@@ -20,11 +27,21 @@ class Dispatcher:
             cls._db = Database()
         return cls._db
 
+    @classmethod
+    async def get_db_async(cls):
+        """Initialize the shared Database once, even under concurrent callers."""
+        if cls._db is not None:
+            return cls._db
+        async with cls._db_lock:
+            if cls._db is None:
+                cls._db = await asyncio.to_thread(Database)
+        return cls._db
+
     @classmethod
     async def log_command(cls, user_id: int, user_name: str, command: str, params: str = None):
         """Record an audit trail of the command in Postgres/SQLite."""
-        db = cls.get_db()
-        print(f"[DISPATCH] Logging command: {command} by {user_name}")
+        db = await cls.get_db_async()
+        logger.info("[DISPATCH] Logging command: %s by %s", command, user_name)
         
         # We use a custom alert/log entry for now as a generic 'audit' table
         # might not exist in the current schema. Using record_tick or creating a 
@@ -34,22 +51,21 @@ class Dispatcher:
             with db.get_connection() as conn:
                 cursor = conn.cursor()
                 details = {
+                    **_DETAILS_BASE,
                     "user_id": user_id,
                     "user_name": user_name,
                     "params": params,
-                    "node": IDENTITY.get("name"),
-                    "ip": TAILSCALE_IP
                 }
                 db.create_alert(
                     cursor, 
                     kind="COMMAND_AUDIT", 
-                    proposal_id=f"cmd_{int(datetime.now(timezone.utc).timestamp())}", 
-                    node_id=IDENTITY.get("name"),
+                    proposal_id=f"cmd_{int(time.time())}", 
+                    node_id=_NODE_NAME,
                     details=details
                 )
                 conn.commit()
         except Exception as e:
-            print(f"[ERROR] Failed to log command to DB: {e}")
+            logger.exception("[ERROR] Failed to log command to DB: %s", e)
 
     @staticmethod
     async def run_openclaw(task: str, user_id: int, user_name: str, context: str = ""):
@@ -58,28 +74,22 @@ class Dispatcher:
         """
         await Dispatcher.log_command(user_id, user_name, "deploy", params=f"service={task}, context={context}")
         
-        db = Dispatcher.get_db()
-        print(f"[DISPATCH] Finding available Muscle nodes for task: {task}")
+        db = await Dispatcher.get_db_async()
+        logger.info("[DISPATCH] Finding available Muscle nodes for task: %s", task)
         
         try:
-            # 1. Find Online Nodes and sort by freshest heartbeat
-            nodes = db.list_nodes(status="ONLINE")
-            if not nodes:
+            # 1. Select the ONLINE node with the freshest heartbeat
+            target_node = db.get_freshest_node(status="ONLINE")
+            if not target_node:
                 return {
                     "status": "error",
                     "message": "No online Muscle nodes available to handle the deployment."
                 }
             
-            # Sort by last_heartbeat_at descending
-            nodes.sort(key=lambda x: x.get("last_heartbeat_at", ""), reverse=True)
-            
-            # 2. Select the freshest node
-            target_node = nodes[0]["node_id"]
-            
-            # 3. Create the proposal
-            proposal_id = f"prop_{int(datetime.now(timezone.utc).timestamp())}_{task[:5]}"
-            now = datetime.now(timezone.utc)
-            expires_at = (now + timedelta(hours=1)).isoformat()
+            # 2. Create the proposal
+            now_ts = int(time.time())
+            proposal_id = f"prop_{now_ts}_{task[:5]}"
+            expires_at = datetime.fromtimestamp(now_ts + 3600, tz=timezone.utc).isoformat()
             
             proposal = {
                 "proposal_id": proposal_id,
@@ -105,13 +115,13 @@ class Dispatcher:
                 return {"status": "error", "message": "Failed to record proposal in database."}
 
         except Exception as e:
-            print(f"[ERROR] Dispatch failed: {e}")
+            logger.exception("[ERROR] Dispatch failed: %s", e)
             return {"status": "error", "message": str(e)}
 
     @staticmethod
     async def muscle_status():
         """Checks the status of registered Muscle nodes."""
-        db = Dispatcher.get_db()
+        db = await Dispatcher.get_db_async()
         nodes = db.list_nodes()
         
         # Count active nodes
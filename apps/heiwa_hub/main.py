@@ -1,19 +1,30 @@
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
 
-# Ensure monorepo roots are on sys.path
+try:
+    import uvloop
+except ImportError:  # optional: fall back to the stock asyncio loop
+    uvloop = None
+
 ROOT = Path(__file__).resolve().parents[2]
-if str(ROOT / "packages/heiwa_sdk") not in sys.path:
-    sys.path.insert(0, str(ROOT / "packages/heiwa_sdk"))
-if str(ROOT / "packages/heiwa_protocol") not in sys.path:
-    sys.path.insert(0, str(ROOT / "packages/heiwa_protocol"))
-    sys.path.insert(0, str(ROOT / "packages/heiwa_identity"))
-    sys.path.insert(0, str(ROOT / "packages/heiwa_ui"))
-if str(ROOT / "apps") not in sys.path:
-    sys.path.insert(0, str(ROOT / "apps"))
+# The hub image installs heiwa.pth so the package roots are already on
+# sys.path; plain source checkouts get whichever roots are missing added here.
+for _pkg_root in (
+    "packages/heiwa_sdk",
+    "packages/heiwa_protocol",
+    "packages/heiwa_identity",
+    "packages/heiwa_ui",
+    "apps",
+):
+    _path = str(ROOT / _pkg_root)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from heiwa_sdk.config import load_swarm_env
 load_swarm_env()
@@ -24,10 +35,17 @@ from heiwa_hub.agents.messenger import MessengerAgent
 from heiwa_hub.agents.telemetry import TelemetryAgent
 from heiwa_hub.mcp_server import app as hub_app
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Log records are handed to a queue and written by a listener thread so
+# agents on the event loop never block on stdio.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_enqueue = logging.handlers.QueueHandler(_log_queue)
+_log_enqueue.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_enqueue], force=True)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 
 async def _start_server(port: int):
@@ -100,6 +118,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,27 +1,30 @@
 import asyncio
-import json
+import hashlib
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict
 
 import os
 import uuid
 
-from fastapi import FastAPI, HTTPException, Header, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Header, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from heiwa_sdk import (
     HubStateService,
     MCPBridge,
+    ToolNotFoundError,
+    ToolTimeoutError,
     Database,
     HeiwaBench,
     HeiwaCellCatalog,
     redact_any,
     load_swarm_env,
 )
+from heiwa_sdk import fastjson
 from heiwa_protocol.routing import BrokerRouteRequest
 
 from heiwa_hub.cognition.enrichment import BrokerEnrichmentService
@@ -33,13 +36,29 @@ from heiwa_protocol.protocol import Subject
 load_swarm_env()
 
 logger = logging.getLogger("Hub.MCP")
-app = FastAPI(title="Heiwa Core MCP Server")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through heiwa_sdk.fastjson (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return fastjson.dumpb(content)
+
+
+app = FastAPI(title="Heiwa Core MCP Server", default_response_class=FastJSONResponse)
 db = Database()
 state = HubStateService(db)
 mcp_bridge = MCPBridge()
 enrichment = BrokerEnrichmentService()
 approvals = get_approval_registry()
 TASK_SNAPSHOTS: dict[str, dict[str, Any]] = {}
+MAX_LATEST_TASKS = 100
+STATUS_CACHE_TTL_SEC = 10.0
+TOOLS_CACHE_TTL_SEC = 30.0
+STATUS_STREAM_INTERVAL_SEC = 2.0
+BRIDGE_CALL_TIMEOUT_SEC = 60
+# Short-lived copies of unauthenticated, poll-heavy payloads (status, tool list).
+_RESPONSE_CACHE: dict[str, tuple[float, Any]] = {}
 
 ROOT = Path(__file__).resolve().parents[2]
 bench = HeiwaBench(ROOT)
@@ -51,9 +70,46 @@ if ASSETS_ROOT.exists():
     app.mount("/assets", StaticFiles(directory=str(ASSETS_ROOT)), name="assets")
 
 
-def _web_file(name: str) -> Path | None:
-    candidate = WEB_ROOT / name
-    return candidate if candidate.exists() else None
+# The web client pages are fixed for the life of the process; load them once
+# and serve from memory with a content ETag instead of re-opening the files.
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=60"
+_WEB_PAGES: dict[str, tuple[bytes, str]] = {}
+for _page_name in ("index.html", "status.html", "domains.html", "governance.html"):
+    _page_path = WEB_ROOT / _page_name
+    if _page_path.exists():
+        _page_body = _page_path.read_bytes()
+        _WEB_PAGES[_page_name] = (_page_body, f'"{hashlib.sha1(_page_body).hexdigest()}"')
+
+
+def _web_page(name: str, request: Request) -> Response | None:
+    page = _WEB_PAGES.get(name)
+    if page is None:
+        return None
+    body, etag = page
+    headers = {"ETag": etag, "Cache-Control": STATIC_PAGE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+def _cached(key: str, ttl: float, build: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    hit = _RESPONSE_CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    value = build()
+    _RESPONSE_CACHE[key] = (now, value)
+    return value
+
+
+async def _cached_async(key: str, ttl: float, build: Callable[[], Awaitable[Any]]) -> Any:
+    now = time.monotonic()
+    hit = _RESPONSE_CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    value = await build()
+    _RESPONSE_CACHE[key] = (now, value)
+    return value
 
 
 class MCPTool(BaseModel):
@@ -131,56 +187,82 @@ async def _register_task_snapshot_listeners():
     app.state._task_snapshot_listeners = True
 
 
-@app.get("/health")
-@app.head("/health")
-async def health():
-    return {
+@app.on_event("startup")
+async def _start_status_refresher():
+    if getattr(app.state, "_status_refresher", None) is None:
+        app.state._status_refresher = asyncio.create_task(_refresh_public_status())
+
+
+async def _refresh_public_status():
+    """Keep the public status snapshot warm so /status never aggregates inline."""
+    while True:
+        try:
+            payload = await asyncio.to_thread(_public_status_payload)
+            _RESPONSE_CACHE["status"] = (time.monotonic(), payload)
+        except Exception as exc:
+            logger.warning("Public status refresh failed: %s", exc)
+        await asyncio.sleep(STATUS_CACHE_TTL_SEC)
+
+
+# Everything but the timestamp is fixed per process, so the body prefix is encoded once.
+_HEALTH_PREFIX = fastjson.dumpb(
+    {
         "status": "alive",
         "service": "heiwa-core-hub",
         "state_backend": db.state_backend,
         "gateway_transport": "websocket",
-        "timestamp": time.time(),
     }
+)[:-1] + b',"timestamp":'
+
+
+@app.get("/health")
+@app.head("/health")
+async def health():
+    return Response(content=_HEALTH_PREFIX + repr(time.time()).encode() + b"}", media_type="application/json")
 
 
 @app.get("/")
 @app.head("/")
-async def root():
-    index = _web_file("index.html")
+async def root(request: Request):
+    index = _web_page("index.html", request)
     if index:
-        return FileResponse(index)
+        return index
     return {"name": "Heiwa", "status": "operational"}
 
 
-@app.get("/domains")
-@app.get("/domains.html")
-async def domains_page():
-    page = _web_file("domains.html")
-    if page:
-        return FileResponse(page)
-    raise HTTPException(status_code=404, detail="domains page unavailable")
+# Static client pages: file name -> (routes, label used in the 404 detail).
+_STATIC_PAGES: dict[str, tuple[tuple[str, ...], str]] = {
+    "domains.html": (("/domains", "/domains.html"), "domains"),
+    "governance.html": (("/governance", "/governance.html"), "governance"),
+    "status.html": (("/status.html",), "status"),
+}
 
 
-@app.get("/governance")
-@app.get("/governance.html")
-async def governance_page():
-    page = _web_file("governance.html")
-    if page:
-        return FileResponse(page)
-    raise HTTPException(status_code=404, detail="governance page unavailable")
+def _static_page(name: str, label: str) -> Callable[[Request], Any]:
+    async def serve_page(request: Request):
+        page = _web_page(name, request)
+        if page:
+            return page
+        raise HTTPException(status_code=404, detail=f"{label} page unavailable")
 
+    serve_page.__name__ = f"{label}_page"
+    return serve_page
 
-@app.get("/status.html")
-async def status_page():
-    page = _web_file("status.html")
-    if page:
-        return FileResponse(page)
-    raise HTTPException(status_code=404, detail="status page unavailable")
+
+for _name, (_routes, _label) in _STATIC_PAGES.items():
+    _endpoint = _static_page(_name, _label)
+    for _route in _routes:
+        app.add_api_route(_route, _endpoint, methods=["GET"])
 
 
 @app.get("/status")
 async def get_public_status():
-    return _public_status_payload()
+    # Normally served from the refresher's snapshot; only rebuilt here if it stalls.
+    return await _cached_async(
+        "status",
+        STATUS_CACHE_TTL_SEC * 3,
+        lambda: asyncio.to_thread(_public_status_payload),
+    )
 
 
 def _public_status_payload() -> dict[str, Any]:
@@ -200,87 +282,104 @@ async def status_stream(ws: WebSocket):
     await ws.accept()
     try:
         while True:
-            await ws.send_json(_public_status_payload())
-            await asyncio.sleep(2)
+            # One build + encode per interval, shared by every connected client.
+            frame = await _cached_async(
+                "status_frame",
+                STATUS_STREAM_INTERVAL_SEC,
+                lambda: asyncio.to_thread(lambda: fastjson.dumps(_public_status_payload())),
+            )
+            await ws.send_text(frame)
+            await asyncio.sleep(STATUS_STREAM_INTERVAL_SEC)
     except WebSocketDisconnect:
         logger.debug("Status websocket disconnected.")
 
 
 @app.get("/tools")
 async def list_tools():
-    native_tools = [
-        {
-            "name": "heiwa_get_swarm_status",
-            "description": "Retrieve the public Heiwa state snapshot.",
-            "input_schema": {"type": "object", "properties": {}},
-        },
-        {
-            "name": "heiwa_get_latest_tasks",
-            "description": "Fetch recent Heiwa task runs from the active state backend.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer", "default": 10},
-                },
+    return await _cached_async("tools", TOOLS_CACHE_TTL_SEC, _tools_payload)
+
+
+_NATIVE_TOOLS: list[dict[str, Any]] = [
+    {
+        "name": "heiwa_get_swarm_status",
+        "description": "Retrieve the public Heiwa state snapshot.",
+        "input_schema": {"type": "object", "properties": {}},
+    },
+    {
+        "name": "heiwa_get_latest_tasks",
+        "description": "Fetch recent Heiwa task runs from the active state backend.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "default": 10},
             },
         },
-        {
-            "name": "heiwa_resolve_route",
-            "description": "Resolve a raw task into the typed HeiwaClaw route contract.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string"},
-                    "request_id": {"type": "string"},
-                    "raw_text": {"type": "string"},
-                    "source_surface": {"type": "string", "default": "cli"},
-                    "privacy_level": {"type": "string"},
-                },
-                "required": ["raw_text"],
+    },
+    {
+        "name": "heiwa_resolve_route",
+        "description": "Resolve a raw task into the typed HeiwaClaw route contract.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string"},
+                "request_id": {"type": "string"},
+                "raw_text": {"type": "string"},
+                "source_surface": {"type": "string", "default": "cli"},
+                "privacy_level": {"type": "string"},
             },
+            "required": ["raw_text"],
         },
-        {
-            "name": "heiwa_run_bench",
-            "description": "Run the HeiwaBench release-gate suites for routes and cell selection.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "suite": {"type": "string", "description": "Optional suite name such as routing_matrix or cells_catalog"}
-                },
+    },
+    {
+        "name": "heiwa_run_bench",
+        "description": "Run the HeiwaBench release-gate suites for routes and cell selection.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "suite": {"type": "string", "description": "Optional suite name such as routing_matrix or cells_catalog"}
             },
         },
-        {
-            "name": "heiwa_get_cells_catalog",
-            "description": "List the current HeiwaCells catalog and optionally recommend a cell for a prompt.",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "prompt": {"type": "string", "description": "Optional prompt to match against the cell catalog"}
-                },
+    },
+    {
+        "name": "heiwa_get_cells_catalog",
+        "description": "List the current HeiwaCells catalog and optionally recommend a cell for a prompt.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "prompt": {"type": "string", "description": "Optional prompt to match against the cell catalog"}
             },
         },
-    ]
+    },
+]
 
+
+async def _tools_payload() -> dict[str, Any]:
     try:
-        bridged_tools = mcp_bridge.list_tools()
+        # docker mcp discovery is a subprocess call; keep it off the event loop.
+        bridged_tools = await mcp_bridge.alist_tools()
     except Exception as exc:
         logger.error("Failed to list bridged tools: %s", exc)
         bridged_tools = []
 
-    return {"native": native_tools, "bridged": bridged_tools}
+    return {"native": _NATIVE_TOOLS, "bridged": bridged_tools}
 
 
 @app.post("/call/{tool_name}")
-async def call_tool(tool_name: str, arguments: Dict[str, Any]):
-    safe_args = redact_any(arguments)
-
+async def call_tool(tool_name: str, arguments: Dict[str, Any], pretty: bool = False):
+    """Run a tool; text payloads are compact JSON unless ``?pretty=1`` asks for indentation."""
     if tool_name == "heiwa_get_swarm_status":
-        return {"content": [{"type": "text", "text": json.dumps(state.get_public_status(minutes=60), indent=2)}]}
+        text = _cached(
+            f"swarm_status:{int(pretty)}",
+            STATUS_CACHE_TTL_SEC,
+            lambda: fastjson.dumps(state.get_public_status(minutes=60), pretty),
+        )
+        return {"content": [{"type": "text", "text": text}]}
 
     if tool_name == "heiwa_get_latest_tasks":
-        limit = int(arguments.get("limit", 10) or 10)
-        tasks = state.get_recent_runs(limit=limit)
-        return {"content": [{"type": "text", "text": json.dumps(tasks, indent=2)}]}
+        limit = max(1, min(int(arguments.get("limit", 10) or 10), MAX_LATEST_TASKS))
+        # Blocking DB read (pooled connection); keep it off the event loop.
+        tasks = await asyncio.to_thread(state.get_recent_runs, limit=limit)
+        return {"content": [{"type": "text", "text": fastjson.dumps(tasks, pretty)}]}
 
     if tool_name == "heiwa_resolve_route":
         request = BrokerRouteRequest.from_payload(
@@ -295,29 +394,36 @@ async def call_tool(tool_name: str, arguments: Dict[str, Any]):
             }
         )
         result = enrichment.enrich(request)
-        return {"content": [{"type": "text", "text": json.dumps(result.to_dict(), indent=2)}]}
+        return {"content": [{"type": "text", "text": fastjson.dumps(result.to_dict(), pretty)}]}
 
     if tool_name == "heiwa_run_bench":
         suite = arguments.get("suite")
         result = bench.run(suite=str(suite) if suite else None)
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+        return {"content": [{"type": "text", "text": fastjson.dumps(result, pretty)}]}
 
     if tool_name == "heiwa_get_cells_catalog":
         prompt = str(arguments.get("prompt") or "").strip()
         payload: dict[str, Any] = cells.to_public_dict()
         if prompt:
             payload["recommendation"] = cells.recommend(prompt)
-        return {"content": [{"type": "text", "text": json.dumps(payload, indent=2)}]}
+        return {"content": [{"type": "text", "text": fastjson.dumps(payload, pretty)}]}
 
+    # Only bridged tools forward arguments out of process, so only they need redaction.
+    safe_args = redact_any(arguments)
     try:
-        result = mcp_bridge.call_tool(tool_name, safe_args)
+        # The subprocess carries its own timeout (ToolTimeoutError); wait_for
+        # is the backstop if the thread wedges.
+        result = await asyncio.wait_for(
+            mcp_bridge.acall_tool(tool_name, safe_args, timeout=BRIDGE_CALL_TIMEOUT_SEC),
+            timeout=BRIDGE_CALL_TIMEOUT_SEC + 5,
+        )
         if result["ok"]:
-            return {"content": [{"type": "text", "text": json.dumps(result["result"], indent=2)}]}
+            return {"content": [{"type": "text", "text": fastjson.dumps(result["result"], pretty)}]}
         raise HTTPException(status_code=500, detail=result.get("stderr", "MCP tool failed"))
-    except Exception as exc:
-        if "Tool not found" in str(exc):
-            raise HTTPException(status_code=404, detail="Tool not found")
-        raise
+    except ToolNotFoundError:
+        raise HTTPException(status_code=404, detail="Tool not found")
+    except (ToolTimeoutError, asyncio.TimeoutError):
+        raise HTTPException(status_code=504, detail=f"MCP tool '{tool_name}' timed out")
 
 
 # ---------------------------------------------------------------------------
@@ -518,6 +624,26 @@ async def reject_task(
     )
 
 
+# task_id -> queues of open /ws/tasks sockets. One bus subscriber routes each
+# event by task_id instead of every socket filtering every task event.
+_TASK_EVENT_QUEUES: dict[str, set[asyncio.Queue]] = {}
+
+
+async def _route_task_event(data: Dict[str, Any]):
+    payload = data.get("data", data)
+    for queue in _TASK_EVENT_QUEUES.get(payload.get("task_id"), ()):
+        queue.put_nowait(payload)
+
+
+async def _ensure_task_event_router():
+    if getattr(app.state, "_task_event_router", False):
+        return
+    app.state._task_event_router = True
+    bus = get_bus()
+    for subj in (Subject.TASK_STATUS, Subject.TASK_EXEC_RESULT, Subject.TASK_PROGRESS):
+        await bus.subscribe(subj, _route_task_event)
+
+
 @app.websocket("/ws/tasks/{task_id}")
 async def task_events(ws: WebSocket, task_id: str, token: str | None = None):
     """Stream task events for a specific task to the CLI.
@@ -532,16 +658,8 @@ async def task_events(ws: WebSocket, task_id: str, token: str | None = None):
 
     await ws.accept()
     event_queue: asyncio.Queue = asyncio.Queue()
-
-    async def _capture(data: Dict[str, Any]):
-        payload = data.get("data", data)
-        if payload.get("task_id") == task_id:
-            await event_queue.put(payload)
-
-    bus = get_bus()
-    await bus.subscribe(Subject.TASK_STATUS, _capture)
-    await bus.subscribe(Subject.TASK_EXEC_RESULT, _capture)
-    await bus.subscribe(Subject.TASK_PROGRESS, _capture)
+    await _ensure_task_event_router()
+    _TASK_EVENT_QUEUES.setdefault(task_id, set()).add(event_queue)
 
     terminal_statuses = {"DELIVERED", "PASS", "FAIL", "BLOCKED_AUTH", "BLOCKED_NO_CONTENT"}
     try:
@@ -562,9 +680,12 @@ async def task_events(ws: WebSocket, task_id: str, token: str | None = None):
     except WebSocketDisconnect:
         pass
     finally:
-        # Unsubscribe to avoid leaked callbacks
-        for subj in (Subject.TASK_STATUS, Subject.TASK_EXEC_RESULT, Subject.TASK_PROGRESS):
-            bus.unsubscribe(subj, _capture)
+        # Drop the queue so the router stops feeding a closed socket
+        watchers = _TASK_EVENT_QUEUES.get(task_id)
+        if watchers is not None:
+            watchers.discard(event_queue)
+            if not watchers:
+                _TASK_EVENT_QUEUES.pop(task_id, None)
 
 
 # ---------------------------------------------------------------------------
@@ -590,7 +711,7 @@ async def worker_socket(ws: WebSocket):
 
     try:
         while True:
-            raw = await ws.receive_json()
+            raw = fastjson.loads(await ws.receive_text())
             msg_type = raw.get("type", "")
 
             if msg_type == "register":
@@ -7,6 +7,7 @@ class SwarmOrchestrator:
         self.session_name = session_name
         self.server = libtmux.Server()
         self.session = None
+        self.windows = {}  # window_name -> libtmux Window, kept in step with new_window
 
     def boot_swarm(self):
         """Initializes the tmux session and kills old ones (self-healing)."""
@@ -23,8 +24,19 @@ class SwarmOrchestrator:
             kill_session=True,
             attach=False
         )
+        initial = self.session.attached_window
+        self.windows = {initial.window_name: initial}
         return True
 
+    def _window(self, agent_name):
+        """Indexed window lookup; only windows created outside this orchestrator hit tmux."""
+        window = self.windows.get(agent_name)
+        if window is None and self.session:
+            window = self.session.find_where({"window_name": agent_name})
+            if window:
+                self.windows[agent_name] = window
+        return window
+
     def spawn_agent(self, agent_name, command):
         """Creates a new window for an agent and starts its process."""
         if not self.session:
@@ -34,21 +46,21 @@ class SwarmOrchestrator:
         print(f"[ORCHESTRATOR] Spawning Agent: {agent_name}")
         
         # Check if window exists, else create
-        window = self.session.find_where({"window_name": agent_name})
+        window = self._window(agent_name)
         if not window:
             window = self.session.new_window(attach=False, window_name=agent_name)
+            self.windows[agent_name] = window
         
-        # Send the command to the pane
+        # Send the command to the pane (one round-trip, import path fix included)
         pane = window.attached_pane
-        pane.send_keys("export PYTHONPATH=$PYTHONPATH:$(pwd)") # Fix import paths
-        pane.send_keys(command)
+        pane.send_keys(f"export PYTHONPATH=$PYTHONPATH:$(pwd); {command}")
         
         print(f"[ORCHESTRATOR] {agent_name} is running.")
         return True
 
     def get_agent_logs(self, agent_name, lines=20):
         """Peeks into the agent's pane to capture stdout."""
-        window = self.session.find_where({"window_name": agent_name})
+        window = self._window(agent_name)
         if window:
             pane = window.attached_pane
             return pane.capture_pane(start=-lines)
@@ -0,0 +1,168 @@
+"""
+Smoke test: context_packer glob and deny matching.
+
+Verifies:
+1. glob_many selects the same files as Path.glob, symlinked directories included
+2. matches_any agrees with PurePath.match, and 'dir/**' denies the whole subtree
+3. Denied directories are pruned from the walk
+"""
+
+import importlib.util
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path, PurePosixPath
+
+ROOT = Path(__file__).resolve().parents[3]
+PACKER = ROOT / "apps/heiwa_cli/scripts/agents/context_packer.py"
+
+FILES = [
+    ".hidden/f.md",
+    "a/x.md",
+    "a/b/.env",
+    "a/b/Q.MD",
+    "a/b/[x].md",
+    "a/b/]y.md",
+    "a/b/c/key.pem",
+    "a/b/c/d/e.md",
+    "docs/ARCHITECTURE.md",
+    "docs/agents/UPSTREAM.md",
+    "docs/agents/a/PINNED_VERSION.md",
+    "docs/agents/a/b/UPSTREAM.md",
+    "docs/agents/node_modules/x/UPSTREAM.md",
+    "docs/agents/node_modules/UPSTREAM.md",
+    "docs/agents/runtime/UPSTREAM.md",
+    "src/a.py",
+    "src/sub/b.py",
+    "src/sub/deep/c.py",
+]
+
+PATTERNS = [
+    "docs/ARCHITECTURE.md",
+    "docs/agents/**/UPSTREAM.md",
+    "**/*.md",
+    "**/*.py",
+    "src/*.py",
+    "src/**/*.py",
+    "*/*.md",
+    "a/*/c/*",
+    "a/**",
+    "**",
+    "**/.env",
+    "a/b/[[]x].md",
+    "a/b/[!]x]*.md",
+    "a/b/?.MD",
+    "./docs/*.md",
+    "a/*/*.md",
+    "a/*/*/*.md",
+    "a/*/**/*.md",
+    "a/linkdocs/agents/*.md",
+    "*/linkdocs/**/*.md",
+    "**/linkdocs/*.md",
+    "a/loop/*/*.py",
+    "nope/**/x",
+]
+
+
+def _load_packer():
+    spec = importlib.util.spec_from_file_location("context_packer", PACKER)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve the defining module through sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _tree() -> Path:
+    root = Path(tempfile.mkdtemp(prefix="heiwa-cp-")).resolve()
+    for rel in FILES:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel + "\n", encoding="utf-8")
+    os.symlink(root / "docs", root / "a/linkdocs")
+    os.symlink(root, root / "a/loop")
+    return root
+
+
+def _pathlib_glob(root: Path, patterns) -> list[str]:
+    found = {str(p) for pat in patterns for p in root.glob(pat) if p.is_file()}
+    return sorted(found)
+
+
+def test_glob_matches_pathlib():
+    packer = _load_packer()
+    root = _tree()
+    try:
+        for count in (1, 2):
+            for combo in itertools.combinations(PATTERNS, count):
+                got = packer.glob_many(root, combo)
+                want = _pathlib_glob(root, combo)
+                assert got == want, f"{combo}: {sorted(set(got) ^ set(want))}"
+    finally:
+        shutil.rmtree(root)
+
+
+def test_deny_matches_purepath():
+    packer = _load_packer()
+    rels = [*FILES, "docs/x/.env.local", "k/id_rsa.pub", "a/b.pem"]
+    globs = [g for g in packer.DENY_GLOBS if not g.endswith("/**")]
+    globs += ["*.md", "a/*", "[!a]*/x.md", "a/b/?.MD"]
+    for glob in globs:
+        for rel in rels:
+            want = PurePosixPath(rel).match(glob)
+            assert packer.matches_any(rel, [glob]) == want, f"{glob} vs {rel}"
+
+
+def test_deny_covers_subtree():
+    packer = _load_packer()
+    assert packer.matches_any("node_modules/a.js", ["**/node_modules/**"])
+    assert packer.matches_any("docs/agents/node_modules/x/UPSTREAM.md", ["**/node_modules/**"])
+    assert packer.matches_any(".git/refs/heads/main", ["**/.git/**"])
+    assert packer.matches_any("a/runtime/b/c/d.md", ["**/runtime/**"])
+    assert not packer.matches_any("a/node_modules.md", ["**/node_modules/**"])
+    assert not packer.matches_any("a/my_runtime/b.md", ["**/runtime/**"])
+
+
+def test_denied_dirs_not_walked():
+    packer = _load_packer()
+    root = _tree()
+    try:
+        seen: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            seen.append(str(path))
+            return real_scandir(path)
+
+        packer.os.scandir = scandir
+        try:
+            got = packer.glob_many(root, ["docs/agents/**/UPSTREAM.md"], packer.DENY_GLOBS)
+        finally:
+            packer.os.scandir = real_scandir
+        assert str(root / "docs/agents/a/b/UPSTREAM.md") in got
+        assert not any("node_modules" in p or "runtime" in p for p in seen), seen
+        assert not any("node_modules" in p or "runtime" in p for p in got), got
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    tests = [
+        ("glob_matches_pathlib", test_glob_matches_pathlib),
+        ("deny_matches_purepath", test_deny_matches_purepath),
+        ("deny_covers_subtree", test_deny_covers_subtree),
+        ("denied_dirs_not_walked", test_denied_dirs_not_walked),
+    ]
+    passed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+            passed += 1
+        except Exception as e:
+            print(f"  FAIL  {name}: {e}")
+
+    print(f"\n{passed}/{len(tests)} passed.")
+    sys.exit(0 if passed == len(tests) else 1)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import json
 import os
 import sys
 import tempfile
@@ -69,7 +70,7 @@ def main() -> int:
         if "run-mcp" not in text:
             failures.append("/call/heiwa_get_latest_tasks did not return seeded run")
         bench_payload = client.post("/call/heiwa_run_bench", json={}).json()
-        if '"ok": true' not in bench_payload["content"][0]["text"]:
+        if json.loads(bench_payload["content"][0]["text"]).get("ok") is not True:
             failures.append("/call/heiwa_run_bench did not report success")
         cells_payload = client.post("/call/heiwa_get_cells_catalog", json={"prompt": "implement code refactor"}).json()
         if "codex-builder" not in cells_payload["content"][0]["text"]:
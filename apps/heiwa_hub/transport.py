@@ -17,12 +17,17 @@ from collections import defaultdict
 from typing import Any, Callable, Coroutine, Dict, Optional
 
 from heiwa_protocol.protocol import Subject, Payload
+from heiwa_sdk import fastjson
 
 logger = logging.getLogger("Hub.Transport")
 
 # Type alias for event callbacks
 EventCallback = Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]
 
+# Enum .value/.name go through descriptor lookups; publish() runs per event,
+# so resolve each subject's (bus key, envelope type) once.
+_SUBJECT_KEYS: dict[Subject, tuple[str, str]] = {s: (s.value, s.name) for s in Subject}
+
 
 class LocalBusTransport:
     """
@@ -44,13 +49,13 @@ class LocalBusTransport:
         returns immediately — the dispatch runs in a background task so the
         publisher is never blocked by slow subscribers.
         """
+        key, type_name = _SUBJECT_KEYS[subject]
         envelope = {
             Payload.SENDER_ID: sender_id,
             Payload.TIMESTAMP: time.time(),
-            Payload.TYPE: subject.name,
+            Payload.TYPE: type_name,
             Payload.DATA: data,
         }
-        key = subject.value
         # Snapshot the subscriber list so mutations during dispatch are safe
         callbacks = list(self._subscribers.get(key, []))
         if callbacks:
@@ -206,7 +211,7 @@ class WorkerSessionManager:
         if not ws:
             return False
         try:
-            await ws.send_json({"type": "task_assignment", "data": task_payload})
+            await ws.send_text(fastjson.dumps({"type": "task_assignment", "data": task_payload}))
             return True
         except Exception as exc:
             logger.error("Failed to push task to worker %s: %s", worker_id, exc)
@@ -216,9 +221,10 @@ class WorkerSessionManager:
     async def broadcast(self, message: Dict[str, Any]):
         """Send a message to all connected workers."""
         dead = []
+        frame = fastjson.dumps(message)
         for wid, ws in self._sessions.items():
             try:
-                await ws.send_json(message)
+                await ws.send_text(frame)
             except Exception:
                 dead.append(wid)
         for wid in dead:
@@ -2,7 +2,7 @@ from .config import settings, load_swarm_env
 from .db import Database
 from .heiwaclaw import HeiwaClawGateway
 from .routing import ModelRouter
-from .mcp import MCPBridge
+from .mcp import MCPBridge, ToolNotFoundError, ToolTimeoutError
 from .security import redact_any, redact_text
 from .state import HubStateService
 from .utils import run_cmd
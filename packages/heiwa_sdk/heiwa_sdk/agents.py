@@ -2,6 +2,7 @@
 import asyncio
 import json
 import os
+import signal
 from abc import ABC, abstractmethod
 from heiwa_sdk.nervous_system import HeiwaNervousSystem
 from heiwa_hub.config import IDENTITY
@@ -63,6 +64,16 @@ class HeiwaAgent(ABC):
         """Main loop for the agent."""
         await self.connect_to_spine()
         await self.listen_for_directives(listen_subject)
-        # Keep alive
-        while True:
-            await asyncio.sleep(1)
+        # Park until SIGTERM/SIGINT rather than waking the loop every second.
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # no loop signal support here (Windows, non-main thread)
+        try:
+            await stop.wait()
+        finally:
+            await self.nerve.disconnect()
+            print(f"[{self.name}] Disconnected.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -39,43 +40,48 @@ class HeiwaCellCatalog:
     def __init__(self, root_dir: Path | None = None) -> None:
         self.root = root_dir or Path(__file__).resolve().parents[3]
         self._profiles = load_profiles()
+        self._identities: dict[str, dict[str, Any]] = {}
+        for identity in self._profiles.get("identities", []):
+            self._identities.setdefault(str(identity.get("id") or ""), identity)
+        # Prompts repeat (bench suites, MCP retries); keyword scoring is pure
+        # over the loaded profiles, so memoize it per catalog.
+        self._select = functools.lru_cache(maxsize=64)(self._select_identity)
 
     @property
     def profiles(self) -> dict[str, Any]:
         return self._profiles
 
+    @staticmethod
+    def _cell_from_identity(identity: dict[str, Any]) -> HeiwaCell:
+        targets = dict(identity.get("targets") or {})
+        actions = dict(identity.get("actions") or {})
+        return HeiwaCell(
+            cell_id=str(identity.get("id") or ""),
+            display_name=_display_name_from_id(identity.get("id") or ""),
+            identity_id=str(identity.get("id") or ""),
+            description=str(identity.get("description") or ""),
+            gateway_tool=str(targets.get("tool") or "openclaw"),
+            target_runtime=str(targets.get("runtime") or "macbook@heiwa-node-a"),
+            required_capabilities=list(targets.get("required_capabilities") or []),
+            trigger_keywords=list(identity.get("trigger_keywords") or []),
+            roster=list(identity.get("cells") or []),
+            models=dict(identity.get("models") or {}),
+            report_channel=actions.get("report_channel"),
+            work_channel=actions.get("discord_channel"),
+        )
+
     def list_cells(self) -> list[HeiwaCell]:
-        cells: list[HeiwaCell] = []
-        for identity in self._profiles.get("identities", []):
-            targets = dict(identity.get("targets") or {})
-            actions = dict(identity.get("actions") or {})
-            cells.append(
-                HeiwaCell(
-                    cell_id=str(identity.get("id") or ""),
-                    display_name=_display_name_from_id(identity.get("id") or ""),
-                    identity_id=str(identity.get("id") or ""),
-                    description=str(identity.get("description") or ""),
-                    gateway_tool=str(targets.get("tool") or "openclaw"),
-                    target_runtime=str(targets.get("runtime") or "macbook@heiwa-node-a"),
-                    required_capabilities=list(targets.get("required_capabilities") or []),
-                    trigger_keywords=list(identity.get("trigger_keywords") or []),
-                    roster=list(identity.get("cells") or []),
-                    models=dict(identity.get("models") or {}),
-                    report_channel=actions.get("report_channel"),
-                    work_channel=actions.get("discord_channel"),
-                )
-            )
-        return cells
+        return [self._cell_from_identity(identity) for identity in self._profiles.get("identities", [])]
 
     def get_cell(self, cell_id: str) -> HeiwaCell | None:
-        needle = str(cell_id or "").strip()
-        for cell in self.list_cells():
-            if cell.cell_id == needle:
-                return cell
-        return None
+        identity = self._identities.get(str(cell_id or "").strip())
+        return self._cell_from_identity(identity) if identity is not None else None
+
+    def _select_identity(self, prompt: str) -> dict[str, Any]:
+        return select_identity(prompt, self._profiles)
 
     def recommend(self, prompt: str) -> dict[str, Any]:
-        selection = select_identity(prompt, self._profiles)
+        selection = self._select(prompt)
         selected = dict(selection.get("selected") or {})
         identity_id = str(selected.get("id") or "")
         cell = self.get_cell(identity_id)
@@ -69,4 +69,4 @@ class LLMProvider:
             yield f"Execution failed: {output}"
 
     async def close(self):
-        pass
+        await self.gateway.close()
@@ -74,8 +74,19 @@ def _bool_env(key: str) -> bool:
     return str(os.getenv(key, "")).strip().lower() in {"1", "true", "yes", "on"}
 
 
-def load_swarm_env():
-    """Enterprise-grade environment loader. Priority: Vault > Local Worker > Standard Env."""
+_SWARM_ENV_LOADED = False
+
+
+def load_swarm_env(force: bool = False):
+    """Enterprise-grade environment loader. Priority: Vault > Local Worker > Standard Env.
+
+    Entry points and the modules they import all call this; the files are
+    parsed once per process unless ``force`` is set.
+    """
+    global _SWARM_ENV_LOADED
+    if _SWARM_ENV_LOADED and not force:
+        return
+    _SWARM_ENV_LOADED = True
     vault_path = Path.home() / ".heiwa" / "vault.env"
     
     # 1. Standard .env (Base)
@@ -133,6 +144,9 @@ class Settings:
     @property
     def DATABASE_PATH(self): return get_env("DATABASE_PATH", default="./hub.db", required=False)
 
+    @property
+    def HEIWA_DB_POOL_MAX(self): return int(get_env("HEIWA_DB_POOL_MAX", default="10", required=False) or "10")
+
     @property
     def HEIWA_STATE_BACKEND(self):
         default = "spacetimedb" if self.IS_PROD else "compatibility_sqlite"
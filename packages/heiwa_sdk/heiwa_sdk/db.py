@@ -7,6 +7,7 @@ import uuid
 import os
 import logging
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Optional, List, Any, Dict, Union, Callable, TYPE_CHECKING
@@ -17,6 +18,7 @@ from .spacetimedb import SpacetimeDB
 try:
     import psycopg2
     import psycopg2.extras
+    import psycopg2.pool
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
@@ -24,6 +26,72 @@ except ImportError:
 
 logger = logging.getLogger("SDK.Database")
 
+# Postgres pools are shared by every Database instance pointing at the same DSN.
+_PG_POOLS: Dict[str, Any] = {}
+_PG_POOLS_LOCK = threading.Lock()
+
+# Heartbeats land several times a second across agents; format the ISO stamp
+# at most once per wall-clock second and reuse it.
+_NOW_ISO_CACHE: List[Any] = [0, ""]
+
+
+def _utc_now_iso() -> str:
+    sec = int(time.time())
+    if _NOW_ISO_CACHE[0] != sec:
+        _NOW_ISO_CACHE[1] = datetime.datetime.fromtimestamp(
+            sec, datetime.timezone.utc
+        ).isoformat()
+        _NOW_ISO_CACHE[0] = sec
+    return _NOW_ISO_CACHE[1]
+
+
+class _PooledConnection:
+    """psycopg2 connection proxy whose close() returns the connection to its pool.
+
+    With ``pool=None`` (a direct connection opened when the pool is exhausted)
+    close() closes it, so callers see the same lifetime either way.
+    """
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        if self._pool is None:
+            conn.close()
+            return
+        try:
+            self._pool.putconn(conn)
+        except Exception:
+            conn.close()
+
+    def __del__(self):
+        # The pool tracks handed-out connections itself, so a proxy dropped
+        # without close() would otherwise hold its slot for good.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self.close()
+        return False
+
 
 class Database:
     # Type stubs for monkey-patched methods
@@ -95,11 +163,30 @@ class Database:
             logger.critical("Cannot access DATABASE_PATH %s: %s", self.db_path, e)
             sys.exit(1)
 
+    def _pg_pool(self):
+        pool = _PG_POOLS.get(self.database_url)
+        if pool is None:
+            with _PG_POOLS_LOCK:
+                pool = _PG_POOLS.get(self.database_url)
+                if pool is None:
+                    pool = psycopg2.pool.ThreadedConnectionPool(
+                        1, settings.HEIWA_DB_POOL_MAX, dsn=self.database_url
+                    )
+                    _PG_POOLS[self.database_url] = pool
+        return pool
+
     def get_connection(self):
         if self.use_postgres:
-            conn = psycopg2.connect(self.database_url)
+            pool = self._pg_pool()
+            try:
+                conn = pool.getconn()
+            except psycopg2.pool.PoolError:
+                logger.warning("[DB] Connection pool exhausted; opening a direct connection.")
+                conn = psycopg2.connect(self.database_url)
+                conn.autocommit = False
+                return _PooledConnection(None, conn)
             conn.autocommit = False
-            return conn
+            return _PooledConnection(pool, conn)
         else:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
@@ -386,6 +473,12 @@ class Database:
             ]:
                 col_type = "INTEGER DEFAULT 1" if col == "max_concurrency" else "TEXT"
                 self._safe_alter_column(cursor, "nodes", col, col_type)
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_nodes_status_heartbeat
+                ON nodes(status, last_heartbeat_at DESC)
+            """
+            )
 
             # Phase 2 Migration: Node Profile columns
             for col in ["trust_tier", "privilege_tier", "profile_json"]:
@@ -549,6 +642,12 @@ class Database:
 
     def _init_db(self):
         conn = self.get_connection()
+        try:
+            self._init_db_schema(conn)
+        finally:
+            conn.close()
+
+    def _init_db_schema(self, conn):
         cursor = conn.cursor()
 
         # Proposals Table (with lease tracking)
@@ -599,6 +698,12 @@ class Database:
         ]:
             col_type = "INTEGER DEFAULT 1" if col == "max_concurrency" else "TEXT"
             self._safe_alter_column(cursor, "nodes", col, col_type)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_nodes_status_heartbeat
+            ON nodes(status, last_heartbeat_at DESC)
+        """
+        )
 
         # Migration: Add columns if missing
         for col in ["payload_raw", "lease_expires_at"]:
@@ -805,7 +910,6 @@ class Database:
         )
 
         conn.commit()
-        conn.close()
 
     def get_liveness_state(self, key):
         if self.state_backend == "spacetimedb" and self.stdb:
@@ -959,7 +1063,7 @@ class Database:
             )
         conn = self.get_connection()
         cursor = conn.cursor()
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        now = _utc_now_iso()
 
         try:
             # Check if exists
@@ -1043,6 +1147,29 @@ class Database:
         finally:
             conn.close()
 
+    def get_freshest_node(self, status="ONLINE"):
+        """Return the node_id with the most recent heartbeat for a status, or None."""
+        if self.state_backend == "spacetimedb" and self.stdb:
+            nodes = self.stdb.list_nodes(status=status)
+            if not nodes:
+                return None
+            return max(nodes, key=lambda x: x.get("last_heartbeat_at") or "")["node_id"]
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            self._exec(
+                cursor,
+                # Postgres sorts NULLs first under DESC; a node that never
+                # sent a heartbeat is only picked when no other is online.
+                "SELECT node_id FROM nodes WHERE status = ? "
+                "ORDER BY last_heartbeat_at IS NULL, last_heartbeat_at DESC LIMIT 1",
+                (status,),
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
     def get_node(self, node_id):
         """Get a single node."""
         if self.state_backend == "spacetimedb" and self.stdb:
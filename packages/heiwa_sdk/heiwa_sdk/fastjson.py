@@ -0,0 +1,39 @@
+"""Compact JSON encoding for wire payloads: orjson when installed, stdlib json otherwise."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    _PRETTY_OPTIONS = _OPTIONS | orjson.OPT_INDENT_2
+
+    def dumpb(obj: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, default=str, option=_PRETTY_OPTIONS if pretty else _OPTIONS)
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        return dumpb(obj, pretty).decode()
+
+    def loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(obj, indent=2, default=str)
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+    def dumpb(obj: Any, pretty: bool = False) -> bytes:
+        return dumps(obj, pretty).encode()
+
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
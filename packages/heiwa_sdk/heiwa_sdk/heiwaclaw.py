@@ -190,6 +190,9 @@ class HeiwaClawGateway:
 
         return exit_code, output
 
+    async def close(self) -> None:
+        await self.tool_mesh.close()
+
     @staticmethod
     def _record_rate_usage(dispatch: HeiwaClawDispatch, exit_code: int, output: str) -> None:
         """Record rate-group usage after execution. Detects throttle signals."""
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import subprocess
@@ -8,6 +9,15 @@ from .security import redact_text
 
 logger = logging.getLogger("SDK.MCP")
 
+
+class ToolNotFoundError(KeyError):
+    """Raised when the MCP gateway does not know the requested tool."""
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a bridged tool call runs past its timeout."""
+
+
 class MCPBridge:
     """
     Bridge to Model Context Protocol (MCP) servers.
@@ -34,6 +44,14 @@ class MCPBridge:
             
         return []
 
+    async def alist_tools(self, timeout: int = 25) -> List[Dict[str, Any]]:
+        """list_tools() on a worker thread, for callers running on an event loop."""
+        return await asyncio.to_thread(self.list_tools, timeout)
+
+    async def acall_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: int = 60) -> Dict[str, Any]:
+        """call_tool() on a worker thread, for callers running on an event loop."""
+        return await asyncio.to_thread(self.call_tool, tool_name, arguments, timeout)
+
     def call_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: int = 60) -> Dict[str, Any]:
         """Call an MCP tool."""
         args = ["docker", "mcp", "tools", "call", tool_name]
@@ -50,6 +68,10 @@ class MCPBridge:
 
         logger.info(f"🔌 [MCP] Calling tool: {tool_name}")
         result = run_cmd(args, timeout=timeout)
+        if result.timed_out:
+            raise ToolTimeoutError(tool_name)
+        if result.returncode != 0 and "Tool not found" in result.stderr:
+            raise ToolNotFoundError(tool_name)
         
         # Parse stdout for 'Tool call took: ...ms'
         stdout_clean = result.stdout.strip()
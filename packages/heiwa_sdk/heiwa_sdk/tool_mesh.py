@@ -1,12 +1,52 @@
 import asyncio
+import itertools
+import json
 import logging
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Optional, Tuple
 
 logger = logging.getLogger("SDK.ToolMesh")
 
+# Python wrappers that answer NDJSON requests when started with --serve. They
+# are kept warm so a call skips interpreter start-up and module imports.
+SERVE_WRAPPERS = frozenset({"ollama_exec.py"})
+WARM_TTL_SEC = float(os.getenv("HEIWA_TOOLMESH_WARM_TTL", "600"))
+# Time an idle wrapper gets to finish its serve loop (and flush its logs)
+# after stdin closes, before it is killed.
+WARM_STOP_GRACE_SEC = 5.0
+# Replies carry the whole tool output on one line.
+WARM_LINE_LIMIT = 16 * 1024 * 1024
+# Per-stream capture ceilings for one-shot wrappers; the rest is drained so
+# the child never blocks on a full pipe, but not kept.
+STDOUT_CAP_BYTES = 1024 * 1024
+STDERR_CAP_BYTES = 256 * 1024
+# Warm replies arrive as one string; keep the same total the one-shot path does.
+WARM_OUTPUT_CAP_BYTES = STDOUT_CAP_BYTES + STDERR_CAP_BYTES
+_READ_CHUNK = 64 * 1024
+
+
+async def _bounded_read(stream: asyncio.StreamReader, cap: int) -> tuple[bytes, int]:
+    """Return the first ``cap`` bytes of ``stream`` and how many were dropped."""
+    kept = bytearray()
+    dropped = 0
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            return bytes(kept), dropped
+        room = cap - len(kept)
+        if room > 0:
+            kept += chunk[:room]
+        dropped += max(0, len(chunk) - max(room, 0))
+
+
+def _truncated(output: str, dropped: int) -> str:
+    if dropped:
+        output += f"\n[HEIWA TOOLMESH] output truncated ({dropped} bytes dropped)"
+    return output
+
 
 class ToolMesh:
     """Thin execution layer for localized tool wrappers."""
@@ -14,9 +54,34 @@ class ToolMesh:
     def __init__(self, root_dir: Path):
         self.root = root_dir
         self.wrappers_dir = self.root / "apps/heiwa_cli/scripts/agents/wrappers"
+        # wrapper name -> idle (process, last_used) pairs
+        self._warm: dict[str, list[tuple[asyncio.subprocess.Process, float]]] = {}
+        self._request_ids = itertools.count(1)
+        # Background stops of reaped idle wrappers, awaited by close().
+        self._stopping: set[asyncio.Task] = set()
+        self._root_str = str(self.root)
+        self._wrappers = self._build_wrapper_map()
+        # Wrappers ship with the checkout, so stat them once rather than per
+        # call, and keep the launch prefix ready alongside.
+        self._launch: dict[str, list[str]] = {
+            tool: self._launch_prefix(wrapper)
+            for tool, wrapper in self._wrappers.items()
+            if wrapper.exists()
+        }
+
+    @staticmethod
+    def _launch_prefix(wrapper: Path) -> list[str]:
+        if wrapper.suffix == ".sh":
+            return ["bash", str(wrapper)]
+        if wrapper.suffix == ".py":
+            return [sys.executable, str(wrapper)]
+        return [str(wrapper)]
 
     def _wrapper_for_tool(self, tool: str) -> Path | None:
-        wrapper_map = {
+        return self._wrappers.get(tool.lower())
+
+    def _build_wrapper_map(self) -> dict[str, Path]:
+        return {
             "heiwa_code": self.wrappers_dir / "codex_exec.sh",
             "heiwa_claude": self.wrappers_dir / "claude_exec.sh",
             "heiwa_claw": self.wrappers_dir / "openclaw_exec.sh",
@@ -36,7 +101,6 @@ class ToolMesh:
             "vllm": self.wrappers_dir / "ollama_exec.py",
             "litellm": self.wrappers_dir / "ollama_exec.py",
         }
-        return wrapper_map.get(tool.lower())
 
     async def execute(
         self,
@@ -45,41 +109,140 @@ class ToolMesh:
         model: Optional[str] = None,
         extra_env: Optional[dict[str, str]] = None,
     ) -> Tuple[int, str]:
-        wrapper = self._wrapper_for_tool(tool)
-        if not wrapper or not wrapper.exists():
+        tool_key = tool.lower()
+        launch = self._launch.get(tool_key)
+        if launch is None:
             return 2, f"❌ [HEIWA TOOLMESH] Tool '{tool}' is unavailable."
+        wrapper = self._wrappers[tool_key]
 
-        env = os.environ.copy()
-        env.update(extra_env or {})
+        overrides = dict(extra_env or {})
         if model:
-            env["HEIWA_ACTIVE_MODEL"] = model
-            env["HEIWA_MODEL_BASENAME"] = model.split("/", 1)[1] if "/" in model else model
-            env.setdefault("OPENCLAW_MODEL", model)
-            env.setdefault("GEMINI_MODEL", env["HEIWA_MODEL_BASENAME"])
-            env.setdefault("CLAUDE_MODEL", env["HEIWA_MODEL_BASENAME"])
-            env.setdefault("CODEX_MODEL", env["HEIWA_MODEL_BASENAME"])
-            if tool.lower() in {"ollama", "local", "vllm", "litellm", "heiwa_reflex"}:
-                env["HEIWA_OLLAMA_MODEL"] = model.split("/", 1)[1] if "/" in model else model
+            basename = model.split("/", 1)[1] if "/" in model else model
+            overrides["HEIWA_ACTIVE_MODEL"] = model
+            overrides["HEIWA_MODEL_BASENAME"] = basename
+            for key, value in (
+                ("OPENCLAW_MODEL", model),
+                ("GEMINI_MODEL", basename),
+                ("CLAUDE_MODEL", basename),
+                ("CODEX_MODEL", basename),
+            ):
+                if key not in overrides and key not in os.environ:
+                    overrides[key] = value
+            if tool_key in {"ollama", "local", "vllm", "litellm", "heiwa_reflex"}:
+                overrides["HEIWA_OLLAMA_MODEL"] = basename
 
         logger.info("🌐 [HEIWA TOOLMESH] Invoking %s via %s", tool, wrapper.name)
 
-        if wrapper.suffix == ".sh":
-            cmd = ["bash", str(wrapper), instruction]
-        elif wrapper.suffix == ".py":
-            cmd = [sys.executable, str(wrapper), instruction]
-        else:
-            cmd = [str(wrapper), instruction]
+        if wrapper.name in SERVE_WRAPPERS:
+            return await self._execute_warm(wrapper, instruction, overrides)
+
+        env = os.environ.copy()
+        env.update(overrides)
 
         try:
             proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=str(self.root),
+                *launch,
+                instruction,
+                cwd=self._root_str,
                 env=env,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await proc.communicate()
+            (stdout, out_dropped), (stderr, err_dropped) = await asyncio.gather(
+                _bounded_read(proc.stdout, STDOUT_CAP_BYTES),
+                _bounded_read(proc.stderr, STDERR_CAP_BYTES),
+            )
+            await proc.wait()
             output = (stdout + stderr).decode(errors="ignore").strip()
-            return int(proc.returncode), output
+            return int(proc.returncode), _truncated(output, out_dropped + err_dropped)
         except Exception as exc:
             return 1, f"Tool mesh execution error: {exc}"
+
+    async def _execute_warm(self, wrapper: Path, instruction: str, overrides: dict[str, str]) -> Tuple[int, str]:
+        try:
+            proc = await self._acquire_warm(wrapper)
+        except Exception as exc:
+            return 1, f"Tool mesh execution error: {exc}"
+
+        request_id = next(self._request_ids)
+        request = {"id": request_id, "payload": instruction, "env": overrides}
+        reusable = False
+        try:
+            proc.stdin.write(json.dumps(request).encode() + b"\n")
+            await proc.stdin.drain()
+            line = await proc.stdout.readline()
+            if not line:
+                return 1, f"Tool mesh execution error: {wrapper.name} exited"
+            reply = json.loads(line)
+            if reply.get("id") != request_id:
+                return 1, f"Tool mesh execution error: {wrapper.name} answered out of order"
+            reusable = True
+            output = str(reply.get("output") or "").encode()
+            dropped = max(0, len(output) - WARM_OUTPUT_CAP_BYTES)
+            text = output[:WARM_OUTPUT_CAP_BYTES].decode(errors="ignore")
+            return int(reply.get("code", 1)), _truncated(text, dropped)
+        except Exception as exc:
+            return 1, f"Tool mesh execution error: {exc}"
+        finally:
+            # Anything short of a clean reply (including cancellation) leaves
+            # the pipe in an unknown state, so that process is not reused.
+            if reusable:
+                self._warm.setdefault(wrapper.name, []).append((proc, time.monotonic()))
+            else:
+                self._retire(proc)
+
+    async def _acquire_warm(self, wrapper: Path) -> asyncio.subprocess.Process:
+        self._reap_idle(time.monotonic())
+        idle = self._warm.setdefault(wrapper.name, [])
+        while idle:
+            proc, _ = idle.pop()
+            if proc.returncode is None:
+                return proc
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-u",
+            str(wrapper),
+            "--serve",
+            cwd=self._root_str,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=WARM_LINE_LIMIT,
+        )
+
+    def _reap_idle(self, now: float) -> None:
+        """Stop idle processes of every wrapper that outlived WARM_TTL_SEC."""
+        for name, idle in self._warm.items():
+            keep = []
+            for proc, last_used in idle:
+                if proc.returncode is None and now - last_used < WARM_TTL_SEC:
+                    keep.append((proc, last_used))
+                else:
+                    task = asyncio.ensure_future(self._stop(proc))
+                    self._stopping.add(task)
+                    task.add_done_callback(self._stopping.discard)
+            self._warm[name] = keep
+
+    async def close(self) -> None:
+        """Stop every idle warm wrapper; calls still in flight retire their own."""
+        idle = [proc for pool in self._warm.values() for proc, _ in pool]
+        self._warm.clear()
+        await asyncio.gather(*(self._stop(proc) for proc in idle), *self._stopping, return_exceptions=True)
+
+    @staticmethod
+    async def _stop(proc: asyncio.subprocess.Process) -> None:
+        """Let an idle wrapper leave its serve loop cleanly; kill it if it lingers."""
+        if proc.returncode is None:
+            proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), WARM_STOP_GRACE_SEC)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    @staticmethod
+    def _retire(proc: asyncio.subprocess.Process) -> None:
+        """Kill a wrapper whose pipe is in an unknown state (failed or cancelled call)."""
+        if proc.returncode is not None:
+            return
+        proc.stdin.close()
+        proc.kill()
@@ -34,18 +34,22 @@ def read_file(path: str, start_line: int = None, end_line: int = None) -> Dict[s
     
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-        
-        total_lines = len(lines)
-        
-        if start_line is not None and end_line is not None:
-            # Convert to 0-indexed
-            start_idx = max(0, start_line - 1)
-            end_idx = min(total_lines, end_line)
-            lines = lines[start_idx:end_idx]
+            if start_line is not None and end_line is not None:
+                # Convert to 0-indexed; stream so only the requested window is kept
+                start_idx = max(0, start_line - 1)
+                lines = []
+                total_lines = 0
+                for idx, line in enumerate(f):
+                    total_lines = idx + 1
+                    if start_idx <= idx < end_line:
+                        lines.append(line)
+                content = "".join(lines)
+            else:
+                content = f.read()
+                total_lines = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
         
         return {
-            "content": "".join(lines),
+            "content": content,
             "total_lines": total_lines,
             "path": path
         }
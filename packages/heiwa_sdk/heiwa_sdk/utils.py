@@ -16,6 +16,7 @@ class CommandResult:
     stdout: str
     stderr: str
     duration_ms: int
+    timed_out: bool = False
 
     def to_dict(self) -> dict:
         return {
@@ -56,6 +57,7 @@ def run_cmd(args: List[str], cwd: Optional[Path] = None, timeout: int = 120) ->
             stdout="",
             stderr=f"Command timed out after {timeout}s",
             duration_ms=int((time.time() - start) * 1000),
+            timed_out=True,
         )
     except Exception as e:
         return CommandResult(
@@ -35,6 +35,18 @@ class UIManager:
         "node": "⚙️"
     }
 
+    TASK_STATUS_TEXT = {
+        "thinking": f"{EMOJIS['brain']} Thinking...",
+        "executing": f"{EMOJIS['executing']} Executing...",
+        "completed": f"{EMOJIS['success']} Completed",
+        "bridged": f"{EMOJIS['bridged']} Bridged to Swarm",
+        "error": f"{EMOJIS['warning']} Error"
+    }
+
+    # Footers are rebuilt for every embed; bind the formatters once.
+    BASE_FOOTER = "Railway: {} | Provider: {} | Tokens: {} | Node: {}".format
+    TASK_FOOTER = "Cloud HQ: {} | Provider: {} | Node: {}".format
+
     @staticmethod
     def create_base_embed(title, description, status="thinking", metrics=None, snapshot=None):
         emoji = UIManager.EMOJIS.get(status, "🔵")
@@ -53,14 +65,10 @@ class UIManager:
         
         # Tracked Snapshot Footer
         if snapshot:
-            railway = snapshot.get("railway", "Online")
-            tokens = snapshot.get("tokens", 0)
-            local_health = snapshot.get("local_health", "Stable")
-            node_id = snapshot.get("node_id", "Unknown")
-            provider = snapshot.get("provider", "Ollama")
-            
-            footer_text = f"Railway: {railway} | Provider: {provider} | Tokens: {tokens} | Node: {node_id}"
-            embed.set_footer(text=footer_text)
+            get = snapshot.get
+            embed.set_footer(text=UIManager.BASE_FOOTER(
+                get("railway", "Online"), get("provider", "Ollama"), get("tokens", 0), get("node_id", "Unknown")
+            ))
         else:
             embed.set_footer(text="Heiwa Swarm Control Plane")
             
@@ -77,15 +85,7 @@ class UIManager:
         )
         embed.set_author(name=UIManager.BRAND_NAME)
         
-        status_map = {
-            "thinking": f"{UIManager.EMOJIS['brain']} Thinking...",
-            "executing": f"{UIManager.EMOJIS['executing']} Executing...",
-            "completed": f"{UIManager.EMOJIS['success']} Completed",
-            "bridged": f"{UIManager.EMOJIS['bridged']} Bridged to Swarm",
-            "error": f"{UIManager.EMOJIS['warning']} Error"
-        }
-        
-        status_text = status_map.get(status, status)
+        status_text = UIManager.TASK_STATUS_TEXT.get(status, status)
         embed.add_field(name="Current Status", value=status_text, inline=True)
         
         if usage:
@@ -105,11 +105,10 @@ class UIManager:
                 embed.add_field(name="Result", value=f"```\n{result_text}\n```", inline=False)
             
         if snapshot:
-            railway = snapshot.get("railway", "Online")
-            node_id = snapshot.get("node_id", "Unknown")
-            provider = snapshot.get("provider", "Ollama")
-            footer_text = f"Cloud HQ: {railway} | Provider: {provider} | Node: {node_id}"
-            embed.set_footer(text=footer_text)
+            get = snapshot.get
+            embed.set_footer(text=UIManager.TASK_FOOTER(
+                get("railway", "Online"), get("provider", "Ollama"), get("node_id", "Unknown")
+            ))
             
         return embed
 